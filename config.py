@@ -1,6 +1,8 @@
 # Fichier de configuration pour les simulations DCA
 # Vous pouvez modifier ces valeurs selon vos besoins
 
+from types import MappingProxyType
+
 # Configuration par défaut
 DEFAULT_CONFIG = {
     "investissement_annuel": 1000.0,  # USD
@@ -47,6 +49,9 @@ SCENARIOS = {
     }
 }
 
+# Scénarios en lecture seule : partagés sans copie défensive par les simulateurs
+SCENARIOS = MappingProxyType({nom: MappingProxyType(config) for nom, config in SCENARIOS.items()})
+
 # Périodes historiques intéressantes pour l'analyse
 PERIODES_HISTORIQUES = {
     "bretton_woods_fin": (1968, 1975),  # Fin du système de Bretton Woods
@@ -0,0 +1,33 @@
+"""
+Chargement partagé des données historiques annuelles du prix de l'or
+Le CSV n'est lu et analysé qu'une seule fois par processus
+"""
+
+import functools
+import numpy as np
+from typing import Tuple
+
+@functools.lru_cache(maxsize=4)
+def load_prices(data_file: str = "data/annual.csv") -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Charge une seule fois par fichier les années et prix de l'or
+    
+    Returns:
+        Tuple (annees, prix) d'arrays NumPy en lecture seule, partagés par
+        tous les simulateurs du processus (historique, Monte Carlo, volatilité)
+    """
+    # Lecture directe en NumPy avec schéma explicite (pas de DataFrame intermédiaire)
+    with open(data_file, encoding='utf-8') as fichier:
+        entete = fichier.readline().strip().split(',')
+        donnees = np.loadtxt(fichier, delimiter=',', ndmin=1,
+                             usecols=(entete.index('Date'), entete.index('Price')),
+                             dtype=[('Date', np.int32), ('Price', np.float64)])
+    
+    # Années triées (requis par les recherches dichotomiques)
+    if np.any(donnees['Date'][1:] < donnees['Date'][:-1]):
+        donnees = donnees[np.argsort(donnees['Date'], kind='stable')]
+    annees = np.ascontiguousarray(donnees['Date'])
+    prix = np.ascontiguousarray(donnees['Price'])
+    annees.setflags(write=False)
+    prix.setflags(write=False)
+    return annees, prix
@@ -3,13 +3,192 @@ Simulation d'investissement DCA (Dollar Cost Averaging) annuel sur l'or
 Basé sur les données historiques de prix de l'or de 1833 à 2024
 """
 
+import functools
+import os
+import sys
+from dataclasses import dataclass, fields
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import Dict, List, Tuple
+from typing import Dict, List, Sequence, Tuple
+from data_cache import load_prices
+
+@dataclass(slots=True)
+class DCAResults:
+    """
+    Résultats année par année d'une simulation DCA historique (arrays NumPy)
+    """
+    annees: np.ndarray
+    prix_or: np.ndarray
+    investissement_cumule: np.ndarray
+    onces_achetees_annee: np.ndarray
+    onces_totales: np.ndarray
+    valeur_portefeuille: np.ndarray
+    frais_totaux: np.ndarray
+    profit_perte: np.ndarray
+    rendement_pourcent: np.ndarray
+    
+    def __getitem__(self, cle: str) -> np.ndarray:
+        # Compatibilité avec l'ancien accès par clé (resultats['onces_totales'])
+        return getattr(self, cle)
+    
+    @property
+    def prix_moyen_achat(self) -> float:
+        """
+        Prix moyen d'achat final (0 si aucune once n'a été achetée)
+        """
+        # Division sans branche Python : le résultat reste à 0 si onces_totales vaut 0
+        prix_moyen = np.zeros(())
+        np.divide(self.investissement_cumule[-1], self.onces_totales[-1], out=prix_moyen,
+                  where=self.onces_totales[-1] > 0)
+        return float(prix_moyen)
+
+# Noms des colonnes de résultats, dans l'ordre des champs de DCAResults
+_CLES_RESULTATS = tuple(champ.name for champ in fields(DCAResults))
+
+# Gabarit du résumé affiché par afficher_resultats
+_GABARIT_RESUME = "\n".join((
+    "=" * 60,
+    "SIMULATION D'INVESTISSEMENT DCA SUR L'OR",
+    "=" * 60,
+    "Période d'investissement: {annee_debut} - {annee_fin}",
+    "Investissement annuel: {investissement_annuel:,.2f} USD",
+    "Nombre d'années: {nombre_annees}",
+    "Frais par once par an: {frais_par_once:,.2f} USD",
+    "",
+    "RÉSULTATS FINAUX:",
+    "Investissement total: {investissement_total:,.2f} USD",
+    "Onces d'or possédées: {onces_finales:.4f} oz",
+    "Valeur du portefeuille (nette): {valeur_finale:,.2f} USD",
+    "Frais totaux payés: {frais_totaux:,.2f} USD",
+    "Profit/Perte: {profit_final:,.2f} USD",
+    "Rendement: {rendement_final:.2f}%",
+    "",
+    "Prix moyen d'achat: {prix_moyen_achat:.2f} USD/oz",
+    "Prix final de l'or: {prix_final:.2f} USD/oz",
+    ""
+))
+
+# Format d'une ligne du tableau détaillé (colonnes dans l'ordre de _CLES_RESULTATS)
+_FORMAT_TABLEAU = ('%-6d', '%-10.2f', '%-10.0f', '%-8.4f', '%-10.4f',
+                   '%-12.0f', '%-10.0f', '%-12.0f', '%-8.1f%%')
+
+@functools.lru_cache(maxsize=32)
+def _annees_ecoulees(n: int) -> np.ndarray:
+    """
+    Retourne [1, 2, ..., n] en float64, partagé (lecture seule) entre les appels
+    """
+    annees = np.arange(1, n + 1, dtype=np.float64)
+    annees.setflags(write=False)
+    return annees
+
+def _localiser_periode(annees: np.ndarray, annee_debut: int, annee_fin: int) -> Tuple[int, int]:
+    """
+    Localise une période par recherche dichotomique sur les années triées
+    
+    Returns:
+        Tuple (idx0, idx_fin) des indices de la première et de la dernière année
+        
+    Raises:
+        ValueError: si une année de la période manque dans les données
+    """
+    if annee_fin < annee_debut:
+        raise ValueError(f"Période vide ({annee_debut}-{annee_fin})")
+    idx0, idx_fin = np.searchsorted(annees, (annee_debut, annee_fin))
+    
+    # Vérifier que nous avons les données pour la période demandée
+    if idx0 == len(annees) or annees[idx0] != annee_debut:
+        raise ValueError(f"Année de début {annee_debut} non disponible dans les données")
+    if idx_fin == len(annees) or annees[idx_fin] != annee_fin:
+        raise ValueError(f"Année de fin {annee_fin} non disponible dans les données")
+    if idx_fin - idx0 != annee_fin - annee_debut:
+        raise ValueError(f"Données manquantes entre {annee_debut} et {annee_fin}")
+    return int(idx0), int(idx_fin)
+
+@functools.lru_cache(maxsize=256)
+def _simuler_dca_cache(chemin_donnees: str,
+                       date_modification: int,
+                       annee_debut: int,
+                       nombre_annees: int,
+                       investissement_annuel: float,
+                       frais_par_once: float) -> Tuple[np.ndarray, ...]:
+    """
+    Calcule la simulation DCA historique (fonction pure, mise en cache)
+    
+    Le fichier est identifié par son chemin résolu et sa date de modification
+    (st_mtime_ns) : la clé ne dépend pas du répertoire courant et change si
+    le fichier est modifié.
+    
+    Returns:
+        Tuple d'arrays NumPy en lecture seule, dans l'ordre de _CLES_RESULTATS
+    """
+    annees, prix = load_prices(chemin_donnees)
+    
+    # Localiser la période (ValueError si des années manquent)
+    n = nombre_annees
+    idx0, _ = _localiser_periode(annees, annee_debut, annee_debut + n - 1)
+    
+    # Extraire la tranche de prix de la période (une seule opération)
+    prix_or = prix[idx0:idx0 + n]
+    
+    # Buffers pré-alloués (un array float64 contigu par colonne de résultats)
+    investissement_cumule = np.empty(n, dtype=np.float64)
+    onces_achetees = np.empty(n, dtype=np.float64)
+    onces_totales = np.empty(n, dtype=np.float64)
+    valeur_portefeuille = np.empty(n, dtype=np.float64)
+    frais_totaux = np.empty(n, dtype=np.float64)
+    profit_perte = np.empty(n, dtype=np.float64)
+    rendement_pourcent = np.zeros(n, dtype=np.float64)
+    
+    # Investissement cumulé année après année
+    annees_ecoulees = _annees_ecoulees(n)
+    np.multiply(annees_ecoulees, investissement_annuel, out=investissement_cumule)
+    
+    # Onces achetées chaque année et cumul des onces détenues
+    np.divide(investissement_annuel, prix_or, out=onces_achetees)
+    np.cumsum(onces_achetees, out=onces_totales)
+    
+    # Valeur actuelle du portefeuille (sans frais)
+    np.multiply(onces_totales, prix_or, out=valeur_portefeuille)
+    
+    # Frais cumulés (frais sur toutes les onces détenues), calculés en place
+    np.multiply(onces_totales, annees_ecoulees, out=frais_totaux)
+    frais_totaux *= frais_par_once
+    
+    # Valeur nette (en place sur la valeur brute) et profit/perte
+    valeur_portefeuille -= frais_totaux
+    np.subtract(valeur_portefeuille, investissement_cumule, out=profit_perte)
+    
+    # Rendement en pourcentage (reste à 0 si rien n'a été investi)
+    np.divide(profit_perte, investissement_cumule, out=rendement_pourcent,
+              where=investissement_cumule > 0)
+    rendement_pourcent *= 100
+    
+    resultats = (np.arange(annee_debut, annee_debut + n, dtype=np.int32), prix_or, investissement_cumule,
+                 onces_achetees, onces_totales, valeur_portefeuille,
+                 frais_totaux, profit_perte, rendement_pourcent)
+    
+    # Les arrays sont partagés entre appels : les protéger en écriture
+    for arr in resultats:
+        arr.setflags(write=False)
+    return resultats
+
+@functools.lru_cache(maxsize=None)
+def appliquer_style_graphiques():
+    """
+    Applique le style des graphiques (seaborn-v0_8) une seule fois par processus
+    """
+    import matplotlib.pyplot as plt
+    try:
+        plt.style.use('seaborn-v0_8')
+    except OSError:
+        pass
 
 class GoldDCASimulator:
+    # Pas de __dict__ par instance : attributs compacts et accès plus rapide
+    __slots__ = ('data_file', 'df', '_prices', '_years',
+                 'investissement_annuel', 'nombre_annees', 'frais_par_once', 'annee_debut',
+                 '_fig', '_axes', '_lines')
+    
     def __init__(self, data_file: str = "data/annual.csv"):
         """
         Initialise la simulation DCA avec les données historiques de l'or
@@ -17,9 +196,11 @@ class GoldDCASimulator:
         Args:
             data_file: Chemin vers le fichier CSV contenant les données de prix
         """
-        self.df = pd.read_csv(data_file)
-        self.df['Date'] = self.df['Date'].astype(int)
-        self.df = self.df.set_index('Date')
+        # Séries NumPy partagées (le CSV n'est lu qu'une fois par processus)
+        self.data_file = data_file
+        self._years, self._prices = load_prices(data_file)
+        self.df = pd.DataFrame({'Price': self._prices},
+                               index=pd.Index(self._years, name='Date'))
         
         # Variables de configuration
         self.investissement_annuel = 1000.0  # Montant investi chaque année (USD)
@@ -27,6 +208,11 @@ class GoldDCASimulator:
         self.frais_par_once = 50.0           # Frais de stockage/gestion par once par an (USD)
         self.annee_debut = 2000              # Année de début de l'investissement
         
+        # Figure matplotlib réutilisée entre les appels à creer_graphiques
+        self._fig = None
+        self._axes = None
+        self._lines = None
+        
     def configure_simulation(self, 
                            investissement_annuel: float,
                            nombre_annees: int,
@@ -46,113 +232,106 @@ class GoldDCASimulator:
         self.annee_debut = annee_debut
         self.frais_par_once = frais_par_once
         
-    def simuler_dca(self) -> Dict:
+    def donnees_disponibles(self, annee_debut: int, annee_fin: int) -> bool:
         """
-        Exécute la simulation DCA et retourne les résultats
+        Indique si toutes les années de annee_debut à annee_fin sont dans les données
+        """
+        try:
+            _localiser_periode(self._years, annee_debut, annee_fin)
+        except ValueError:
+            return False
+        return True
         
-        Returns:
-            Dictionnaire contenant tous les résultats de la simulation
+    def simuler_dca_periodes(self,
+                             annees_debut: Sequence[int],
+                             annees_fin: Sequence[int],
+                             investissement_annuel: float,
+                             frais_par_once: float) -> Dict[str, np.ndarray]:
         """
-        annee_fin = self.annee_debut + self.nombre_annees - 1
+        Évalue en un seul lot le DCA de plusieurs périodes sur la même série de prix
         
-        # Vérifier que nous avons les données pour la période demandée
-        if self.annee_debut not in self.df.index:
-            raise ValueError(f"Année de début {self.annee_debut} non disponible dans les données")
-        if annee_fin not in self.df.index:
-            raise ValueError(f"Année de fin {annee_fin} non disponible dans les données")
+        Args:
+            annees_debut: Année de début de chaque période
+            annees_fin: Année de fin (incluse) de chaque période
+            investissement_annuel: Montant investi chaque année en USD
+            frais_par_once: Frais annuels par once détenue en USD
             
-        # Initialisation des variables de suivi
-        resultats = {
-            'annees': [],
-            'prix_or': [],
-            'investissement_cumule': [],
-            'onces_achetees_annee': [],
-            'onces_totales': [],
-            'valeur_portefeuille': [],
-            'frais_totaux': [],
-            'profit_perte': [],
-            'rendement_pourcent': []
-        }
+        Returns:
+            Dictionnaire d'arrays (une valeur par période) des résultats en fin de période
+            
+        Raises:
+            ValueError: si une période n'est pas entièrement couverte par les données
+        """
+        debut = np.asarray(annees_debut)
+        fin = np.asarray(annees_fin)
         
-        onces_totales = 0.0
-        investissement_cumule = 0.0
+        # Mêmes vérifications que simuler_dca : une période avec des années manquantes
+        # fausserait la durée, l'investissement et les frais
+        idx_fin = np.array([_localiser_periode(self._years, int(d), int(f))[1]
+                            for d, f in zip(debut, fin)], dtype=np.intp)
         
-        for i, annee in enumerate(range(self.annee_debut, annee_fin + 1)):
-            # Prix de l'or cette année
-            prix_or = self.df.loc[annee, 'Price']
-            
-            # Investissement cette année
-            investissement_cumule += self.investissement_annuel
-            
-            # Calcul du nombre d'onces achetées cette année
-            onces_achetees = self.investissement_annuel / prix_or
-            onces_totales += onces_achetees
-            
-            # Valeur actuelle du portefeuille (sans frais)
-            valeur_portefeuille_brute = onces_totales * prix_or
-            
-            # Calcul des frais cumulés (frais sur toutes les onces détenues)
-            frais_totaux = onces_totales * self.frais_par_once * (i + 1)  # Frais accumulés
-            
-            # Valeur nette du portefeuille
-            valeur_portefeuille_nette = valeur_portefeuille_brute - frais_totaux
-            
-            # Profit/Perte
-            profit_perte = valeur_portefeuille_nette - investissement_cumule
-            
-            # Rendement en pourcentage
-            rendement_pourcent = (profit_perte / investissement_cumule) * 100 if investissement_cumule > 0 else 0
-            
-            # Stocker les résultats
-            resultats['annees'].append(annee)
-            resultats['prix_or'].append(prix_or)
-            resultats['investissement_cumule'].append(investissement_cumule)
-            resultats['onces_achetees_annee'].append(onces_achetees)
-            resultats['onces_totales'].append(onces_totales)
-            resultats['valeur_portefeuille'].append(valeur_portefeuille_nette)
-            resultats['frais_totaux'].append(frais_totaux)
-            resultats['profit_perte'].append(profit_perte)
-            resultats['rendement_pourcent'].append(rendement_pourcent)
+        # Masque M[p, y] : l'année y appartient à la période p
+        masque = (self._years >= debut[:, None]) & (self._years <= fin[:, None])
+        
+        # Onces achetées par période et par année, puis cumul sur toute la série
+        onces = masque * (investissement_annuel / self._prices)
+        np.cumsum(onces, axis=1, out=onces)
+        
+        # Dernière colonne de chaque période
+        lignes = np.arange(len(debut))
+        onces_finales = onces[lignes, idx_fin]
+        duree = (fin - debut + 1).astype(np.float64)
+        investissement_total = duree * investissement_annuel
+        
+        # Même enchaînement d'opérations que simuler_dca (frais sur toutes les onces détenues)
+        frais_totaux = onces_finales * duree * frais_par_once
+        valeur_finale = onces_finales * self._prices[idx_fin] - frais_totaux
+        rendement = (valeur_finale - investissement_total) / investissement_total * 100
+        
+        return {
+            'duree': duree.astype(np.int64),
+            'investissement_total': investissement_total,
+            'valeur_finale': valeur_finale,
+            'onces_finales': onces_finales,
+            'rendement': rendement,
+        }
         
-        return resultats
+    def simuler_dca(self) -> DCAResults:
+        """
+        Exécute la simulation DCA et retourne les résultats
+        
+        Returns:
+            DCAResults contenant tous les résultats de la simulation (arrays NumPy)
+        """
+        # Résultat mémoïsé : fonction pure des paramètres et de la série de prix
+        chemin = os.path.realpath(self.data_file)
+        valeurs = _simuler_dca_cache(chemin, os.stat(chemin).st_mtime_ns,
+                                     self.annee_debut, self.nombre_annees,
+                                     self.investissement_annuel, self.frais_par_once)
+        return DCAResults(*valeurs)
     
-    def afficher_resultats(self, resultats: Dict):
+    def afficher_resultats(self, resultats: DCAResults):
         """
         Affiche un résumé des résultats de la simulation
         """
-        print("=" * 60)
-        print("SIMULATION D'INVESTISSEMENT DCA SUR L'OR")
-        print("=" * 60)
-        print(f"Période d'investissement: {self.annee_debut} - {self.annee_debut + self.nombre_annees - 1}")
-        print(f"Investissement annuel: {self.investissement_annuel:,.2f} USD")
-        print(f"Nombre d'années: {self.nombre_annees}")
-        print(f"Frais par once par an: {self.frais_par_once:,.2f} USD")
-        print()
-        
-        # Résultats finaux
-        investissement_total = resultats['investissement_cumule'][-1]
-        onces_finales = resultats['onces_totales'][-1]
-        valeur_finale = resultats['valeur_portefeuille'][-1]
-        frais_totaux = resultats['frais_totaux'][-1]
-        profit_final = resultats['profit_perte'][-1]
-        rendement_final = resultats['rendement_pourcent'][-1]
+        # Un seul gabarit formaté puis une seule écriture sur la sortie standard
+        sys.stdout.write(_GABARIT_RESUME.format_map({
+            'annee_debut': self.annee_debut,
+            'annee_fin': self.annee_debut + self.nombre_annees - 1,
+            'investissement_annuel': self.investissement_annuel,
+            'nombre_annees': self.nombre_annees,
+            'frais_par_once': self.frais_par_once,
+            'investissement_total': resultats.investissement_cumule[-1],
+            'onces_finales': resultats.onces_totales[-1],
+            'valeur_finale': resultats.valeur_portefeuille[-1],
+            'frais_totaux': resultats.frais_totaux[-1],
+            'profit_final': resultats.profit_perte[-1],
+            'rendement_final': resultats.rendement_pourcent[-1],
+            'prix_moyen_achat': resultats.prix_moyen_achat,
+            'prix_final': resultats.prix_or[-1]
+        }))
         
-        print("RÉSULTATS FINAUX:")
-        print(f"Investissement total: {investissement_total:,.2f} USD")
-        print(f"Onces d'or possédées: {onces_finales:.4f} oz")
-        print(f"Valeur du portefeuille (nette): {valeur_finale:,.2f} USD")
-        print(f"Frais totaux payés: {frais_totaux:,.2f} USD")
-        print(f"Profit/Perte: {profit_final:,.2f} USD")
-        print(f"Rendement: {rendement_final:.2f}%")
-        print()
-        
-        # Prix moyen d'achat
-        prix_moyen_achat = investissement_total / onces_finales if onces_finales > 0 else 0
-        prix_final = resultats['prix_or'][-1]
-        print(f"Prix moyen d'achat: {prix_moyen_achat:.2f} USD/oz")
-        print(f"Prix final de l'or: {prix_final:.2f} USD/oz")
-        
-    def afficher_tableau_detaille(self, resultats: Dict):
+    def afficher_tableau_detaille(self, resultats: DCAResults):
         """
         Affiche un tableau détaillé année par année
         """
@@ -164,31 +343,25 @@ class GoldDCASimulator:
         print(header)
         print("-" * 120)
         
-        for i in range(len(resultats['annees'])):
-            row = f"{resultats['annees'][i]:<6} " \
-                  f"{resultats['prix_or'][i]:<10.2f} " \
-                  f"{resultats['investissement_cumule'][i]:<10.0f} " \
-                  f"{resultats['onces_achetees_annee'][i]:<8.4f} " \
-                  f"{resultats['onces_totales'][i]:<10.4f} " \
-                  f"{resultats['valeur_portefeuille'][i]:<12.0f} " \
-                  f"{resultats['frais_totaux'][i]:<10.0f} " \
-                  f"{resultats['profit_perte'][i]:<12.0f} " \
-                  f"{resultats['rendement_pourcent'][i]:<8.1f}%"
-            print(row)
+        # Toutes les lignes formatées en un seul appel (une colonne par résultat)
+        colonnes = np.column_stack([getattr(resultats, cle) for cle in _CLES_RESULTATS])
+        np.savetxt(sys.stdout, colonnes, fmt=_FORMAT_TABLEAU)
             
-    def creer_graphiques(self, resultats: Dict):
+    def _creer_figure(self):
         """
-        Crée des graphiques pour visualiser les résultats
+        Construit la figure 2x2 et conserve les courbes pour les mises à jour
         """
-        plt.style.use('seaborn-v0_8')
-        fig, axes = plt.subplots(2, 2, figsize=(15, 12))
-        fig.suptitle('Simulation DCA - Investissement Or', fontsize=16, fontweight='bold')
+        # matplotlib n'est importé qu'au premier graphique (démarrage plus rapide)
+        import matplotlib.pyplot as plt
+        appliquer_style_graphiques()
         
-        annees = resultats['annees']
+        # Mise en page « constrained » : recalculée à chaque rendu, avec les données réelles
+        fig, axes = plt.subplots(2, 2, figsize=(15, 12), layout='constrained')
+        fig.suptitle('Simulation DCA - Investissement Or', fontsize=16, fontweight='bold')
         
         # Graphique 1: Évolution de la valeur du portefeuille vs investissement
-        axes[0, 0].plot(annees, resultats['investissement_cumule'], label='Investissement cumulé', linewidth=2)
-        axes[0, 0].plot(annees, resultats['valeur_portefeuille'], label='Valeur portefeuille (nette)', linewidth=2)
+        ln_invest, = axes[0, 0].plot([], [], label='Investissement cumulé', linewidth=2)
+        ln_val, = axes[0, 0].plot([], [], label='Valeur portefeuille (nette)', linewidth=2)
         axes[0, 0].set_title('Évolution de la Valeur du Portefeuille')
         axes[0, 0].set_xlabel('Année')
         axes[0, 0].set_ylabel('Valeur (USD)')
@@ -196,28 +369,58 @@ class GoldDCASimulator:
         axes[0, 0].grid(True, alpha=0.3)
         
         # Graphique 2: Évolution du prix de l'or
-        axes[0, 1].plot(annees, resultats['prix_or'], color='gold', linewidth=2)
+        ln_prix, = axes[0, 1].plot([], [], color='gold', linewidth=2)
         axes[0, 1].set_title('Prix de l\'Or')
         axes[0, 1].set_xlabel('Année')
         axes[0, 1].set_ylabel('Prix (USD/oz)')
         axes[0, 1].grid(True, alpha=0.3)
         
         # Graphique 3: Accumulation d'onces
-        axes[1, 0].plot(annees, resultats['onces_totales'], color='orange', linewidth=2)
+        ln_onces, = axes[1, 0].plot([], [], color='orange', linewidth=2)
         axes[1, 0].set_title('Accumulation d\'Onces d\'Or')
         axes[1, 0].set_xlabel('Année')
         axes[1, 0].set_ylabel('Onces détenues')
         axes[1, 0].grid(True, alpha=0.3)
         
         # Graphique 4: Rendement en pourcentage
-        axes[1, 1].plot(annees, resultats['rendement_pourcent'], color='green', linewidth=2)
+        ln_rend, = axes[1, 1].plot([], [], color='green', linewidth=2)
         axes[1, 1].axhline(y=0, color='red', linestyle='--', alpha=0.7)
         axes[1, 1].set_title('Rendement (%)')
         axes[1, 1].set_xlabel('Année')
         axes[1, 1].set_ylabel('Rendement (%)')
         axes[1, 1].grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        self._fig = fig
+        self._axes = axes
+        self._lines = (ln_invest, ln_val, ln_prix, ln_onces, ln_rend)
+    
+    def creer_graphiques(self, resultats: DCAResults):
+        """
+        Crée des graphiques pour visualiser les résultats
+        
+        La figure est construite au premier appel puis réutilisée : les appels
+        suivants ne font que mettre à jour les données des courbes.
+        """
+        import matplotlib.pyplot as plt
+        
+        # (Re)construire la figure si elle n'existe pas ou a été fermée
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._creer_figure()
+        
+        annees = resultats.annees
+        series = (resultats.investissement_cumule,
+                  resultats.valeur_portefeuille,
+                  resultats.prix_or,
+                  resultats.onces_totales,
+                  resultats.rendement_pourcent)
+        
+        for ligne, valeurs in zip(self._lines, series):
+            ligne.set_data(annees, valeurs)
+        for ax in self._axes.flat:
+            ax.relim()
+            ax.autoscale_view()
+        
+        self._fig.canvas.draw_idle()
         plt.show()
 
 # Fonction principale pour exécuter la simulation
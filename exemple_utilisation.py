@@ -50,25 +50,24 @@ def exemple_simple():
     print(f"1. Investissement annuel fixe: {investissement_annuel:,.2f} USD")
     
     # 2. Valeur de l'investissement sur n années  
-    valeur_finale = resultats['valeur_portefeuille'][-1]
+    valeur_finale = resultats.valeur_portefeuille[-1]
     print(f"2. Valeur finale après {nombre_annees} ans: {valeur_finale:,.2f} USD")
     
     # 3. Nombre d'années d'investissement
     print(f"3. Période d'investissement: {nombre_annees} années ({annee_debut}-{annee_debut + nombre_annees - 1})")
     
     # 4. Nombre d'onces possédées au cours du temps
-    onces_finales = resultats['onces_totales'][-1]
+    onces_finales = resultats.onces_totales[-1]
     print(f"4. Onces d'or finales possédées: {onces_finales:.4f} oz")
     
     # 5. Frais par once
-    frais_totaux = resultats['frais_totaux'][-1]
+    frais_totaux = resultats.frais_totaux[-1]
     print(f"5. Frais totaux payés: {frais_totaux:,.2f} USD")
     print(f"   Frais par once par an: {frais_par_once:.2f} USD")
     
     # Statistiques additionnelles
-    investissement_total = resultats['investissement_cumule'][-1]
-    prix_moyen_achat = investissement_total / onces_finales if onces_finales > 0 else 0
-    prix_final = resultats['prix_or'][-1]
+    prix_moyen_achat = resultats.prix_moyen_achat
+    prix_final = resultats.prix_or[-1]
     
     print(f"\nPrix moyen d'achat: {prix_moyen_achat:.2f} USD/oz")
     print(f"Prix final de l'or: {prix_final:.2f} USD/oz")
@@ -92,8 +91,8 @@ def comparaison_scenarios():
             simulator.configure_simulation(**config)
             resultats = simulator.simuler_dca()
             
-            rendement = resultats['rendement_pourcent'][-1]
-            onces = resultats['onces_totales'][-1]
+            rendement = resultats.rendement_pourcent[-1]
+            onces = resultats.onces_totales[-1]
             
             print(f"{nom_scenario:<15} "
                   f"{config['investissement_annuel']:<10.0f} "
@@ -3,10 +3,10 @@ Exemple d'utilisation des simulations Monte Carlo pour DCA sur l'or
 Démontre les différentes fonctionnalités et cas d'usage
 """
 
-from monte_carlo_dca import MonteCarloGoldDCA
+from dataclasses import replace
+from monte_carlo_dca import MonteCarloGoldDCA, SimParams, simuler_lot
 from hybrid_dca_simulator import HybridDCASimulator
 from volatility_analysis import GoldVolatilityAnalysis
-import numpy as np
 
 def exemple_monte_carlo_simple():
     """
@@ -78,18 +78,18 @@ def exemple_comparaison_scenarios():
         scenario_result = {
             'nom': scenario['nom'],
             'investissement_total': scenario['invest'] * scenario['annees'],
-            'rendement_moyen': stats['rendement_moyen'],
-            'rendement_median': stats['rendement_median'],
-            'prob_profit': stats['prob_profit'],
-            'var_5pct': stats['var_5pct'],
-            'valeur_moyenne': stats['valeur_moyenne']
+            'rendement_moyen': stats.rendement_moyen,
+            'rendement_median': stats.rendement_median,
+            'prob_profit': stats.prob_profit,
+            'var_5pct': stats.var_5pct,
+            'valeur_moyenne': stats.valeur_moyenne
         }
         
         resultats_scenarios.append(scenario_result)
         
-        print(f"   Rendement moyen: {stats['rendement_moyen']:6.1f}%")
-        print(f"   Probabilité profit: {stats['prob_profit']:6.1f}%")
-        print(f"   VaR 5%: {stats['var_5pct']:8,.0f} USD")
+        print(f"   Rendement moyen: {stats.rendement_moyen:6.1f}%")
+        print(f"   Probabilité profit: {stats.prob_profit:6.1f}%")
+        print(f"   VaR 5%: {stats.var_5pct:8,.0f} USD")
     
     # Tableau de comparaison
     print(f"\n{'Scénario':<12} {'Invest.Total':<12} {'Rend.Moy.':<10} {'Prob.Profit':<12} {'VaR 5%':<12}")
@@ -112,65 +112,52 @@ def exemple_analyse_sensibilite():
     
     mc_sim = MonteCarloGoldDCA()
     
-    # Test 1: Impact du prix initial
-    print("\n🔸 Impact du prix initial de l'or:")
+    # Paramètres de référence (volatilité de l'ère moderne)
+    mc_params = mc_sim.volatility_analyzer.get_monte_carlo_params('Modern_Era')
+    reference = SimParams(
+        investissement_annuel=2000,
+        nombre_annees=10,
+        prix_initial=2400,
+        frais_par_once=25,
+        nb_simulations=1000,
+        drift=mc_params['drift'],
+        volatility=mc_params['volatility']
+    )
+    
     prix_initiaux = [2000, 2200, 2400, 2600, 2800]
+    frais_list = [10, 20, 30, 40, 50]
+    durees = [5, 10, 15, 20, 25]
     
-    for prix in prix_initiaux:
-        mc_sim.configure_simulation(
-            investissement_annuel=2000,
-            nombre_annees=10,
-            prix_initial=prix,
-            frais_par_once=25,
-            nb_simulations=1000,
-            period='Modern_Era'
-        )
-        
-        resultats = mc_sim.simuler_dca_monte_carlo()
-        stats = mc_sim.calculer_statistiques(resultats)
-        
-        print(f"   Prix initial {prix:4.0f}$: Rendement moyen {stats['rendement_moyen']:6.1f}%, "
-              f"Prob. profit {stats['prob_profit']:5.1f}%")
+    # Les trois balayages en un seul appel vectorisé : un tirage commun (sur la durée
+    # la plus longue), donc des résultats identiques pour la configuration de
+    # référence dans chaque section
+    balayage = ([replace(reference, prix_initial=prix) for prix in prix_initiaux]
+                + [replace(reference, frais_par_once=frais) for frais in frais_list]
+                + [replace(reference, nombre_annees=duree) for duree in durees])
+    statistiques = [mc_sim.calculer_statistiques(resultats) for resultats in simuler_lot(balayage)]
+    fin_prix = len(prix_initiaux)
+    fin_frais = fin_prix + len(frais_list)
+    stats_prix = statistiques[:fin_prix]
+    stats_frais = statistiques[fin_prix:fin_frais]
+    stats_durees = statistiques[fin_frais:]
+    
+    # Test 1: Impact du prix initial
+    print("\n🔸 Impact du prix initial de l'or:")
+    for prix, stats in zip(prix_initiaux, stats_prix):
+        print(f"   Prix initial {prix:4.0f}$: Rendement moyen {stats.rendement_moyen:6.1f}%, "
+              f"Prob. profit {stats.prob_profit:5.1f}%")
     
     # Test 2: Impact des frais
     print("\n🔸 Impact des frais par once:")
-    frais_list = [10, 20, 30, 40, 50]
-    
-    for frais in frais_list:
-        mc_sim.configure_simulation(
-            investissement_annuel=2000,
-            nombre_annees=10,
-            prix_initial=2400,
-            frais_par_once=frais,
-            nb_simulations=1000,
-            period='Modern_Era'
-        )
-        
-        resultats = mc_sim.simuler_dca_monte_carlo()
-        stats = mc_sim.calculer_statistiques(resultats)
-        
-        print(f"   Frais {frais:2.0f}$/once/an: Rendement moyen {stats['rendement_moyen']:6.1f}%, "
-              f"Prob. profit {stats['prob_profit']:5.1f}%")
+    for frais, stats in zip(frais_list, stats_frais):
+        print(f"   Frais {frais:2.0f}$/once/an: Rendement moyen {stats.rendement_moyen:6.1f}%, "
+              f"Prob. profit {stats.prob_profit:5.1f}%")
     
     # Test 3: Impact de la durée d'investissement
     print("\n🔸 Impact de la durée d'investissement:")
-    durees = [5, 10, 15, 20, 25]
-    
-    for duree in durees:
-        mc_sim.configure_simulation(
-            investissement_annuel=2000,
-            nombre_annees=duree,
-            prix_initial=2400,
-            frais_par_once=25,
-            nb_simulations=1000,
-            period='Modern_Era'
-        )
-        
-        resultats = mc_sim.simuler_dca_monte_carlo()
-        stats = mc_sim.calculer_statistiques(resultats)
-        
-        print(f"   Durée {duree:2.0f} ans: Rendement moyen {stats['rendement_moyen']:6.1f}%, "
-              f"Prob. profit {stats['prob_profit']:5.1f}%")
+    for duree, stats in zip(durees, stats_durees):
+        print(f"   Durée {duree:2.0f} ans: Rendement moyen {stats.rendement_moyen:6.1f}%, "
+              f"Prob. profit {stats.prob_profit:5.1f}%")
 
 def exemple_volatilite_periodes():
     """
@@ -214,8 +201,8 @@ def exemple_volatilite_periodes():
             print(f"{period_name[:24]:<25} "
                   f"{params['drift']*100:<7.1f}% "
                   f"{params['volatility']*100:<7.1f}% "
-                  f"{stats['rendement_moyen']:<9.1f}% "
-                  f"{stats['prob_profit']:<11.1f}%")
+                  f"{stats.rendement_moyen:<9.1f}% "
+                  f"{stats.prob_profit:<11.1f}%")
 
 def exemple_simulation_hybride():
     """
@@ -3,11 +3,14 @@ Simulateur DCA hybride : Historique + Monte Carlo
 Combine les simulations sur données historiques avec les projections Monte Carlo
 """
 
+from collections import OrderedDict
+
 from dca_simulation import GoldDCASimulator
-from monte_carlo_dca import MonteCarloGoldDCA
+from monte_carlo_dca import MonteCarloGoldDCA, simuler_lot
 from volatility_analysis import GoldVolatilityAnalysis
-import numpy as np
-import matplotlib.pyplot as plt
+
+# Nombre maximal de jeux de paramètres Monte Carlo gardés en mémoire (LRU)
+TAILLE_CACHE_MC = 8
 
 class HybridDCASimulator:
     def __init__(self, data_file: str = "data/annual.csv"):
@@ -18,6 +21,61 @@ class HybridDCASimulator:
         self.monte_carlo_simulator = MonteCarloGoldDCA(data_file)
         self.volatility_analyzer = GoldVolatilityAnalysis(data_file)
         
+        # Prix actuel (2024), point de départ des projections, lu une seule fois
+        self.prix_actuel = float(self.volatility_analyzer.df.at[2024, 'Price'])
+        
+        # Résultats et statistiques Monte Carlo déjà calculés, par jeu de paramètres
+        # (SimParams), les moins récemment utilisés étant évincés au-delà de TAILLE_CACHE_MC
+        self._mc_cache = OrderedDict()
+    
+    def _memoriser(self, params, resultats: tuple):
+        """
+        Range un résultat dans le cache, en évinçant le plus ancien si nécessaire
+        """
+        self._mc_cache[params] = resultats
+        if len(self._mc_cache) > TAILLE_CACHE_MC:
+            self._mc_cache.popitem(last=False)
+        
+    def _executer_monte_carlo(self) -> tuple:
+        """
+        Exécute la simulation Monte Carlo configurée, sauf si les mêmes
+        paramètres ont déjà été simulés
+        
+        Returns:
+            Tuple (resultats, statistiques)
+        """
+        params = self.monte_carlo_simulator.parametres()
+        if params in self._mc_cache:
+            self._mc_cache.move_to_end(params)
+            return self._mc_cache[params]
+        resultats_mc = self.monte_carlo_simulator.simuler_dca_monte_carlo(params)
+        statistiques_mc = self.monte_carlo_simulator.calculer_statistiques(resultats_mc)
+        self._memoriser(params, (resultats_mc, statistiques_mc))
+        return resultats_mc, statistiques_mc
+    
+    def _executer_monte_carlo_lot(self, liste_params: list) -> dict:
+        """
+        Exécute en un seul balayage vectorisé (simuler_lot) les jeux de
+        paramètres pas encore présents dans le cache
+        
+        Returns:
+            Dictionnaire {params: (resultats, statistiques)}, indépendant des évictions du cache
+        """
+        resultats_lot = {}
+        a_simuler = []
+        for params in dict.fromkeys(liste_params):
+            if params in self._mc_cache:
+                self._mc_cache.move_to_end(params)
+                resultats_lot[params] = self._mc_cache[params]
+            else:
+                a_simuler.append(params)
+        if a_simuler:
+            for params, resultats_mc in zip(a_simuler, simuler_lot(a_simuler)):
+                statistiques_mc = self.monte_carlo_simulator.calculer_statistiques(resultats_mc)
+                resultats_lot[params] = (resultats_mc, statistiques_mc)
+                self._memoriser(params, resultats_lot[params])
+        return resultats_lot
+        
     def simulation_complete(self,
                           investissement_annuel: float,
                           nombre_annees: int,
@@ -57,9 +115,9 @@ class HybridDCASimulator:
                 
                 resultats['historique'] = {
                     'resultats': resultats_historique,
-                    'rendement_final': resultats_historique['rendement_pourcent'][-1],
-                    'valeur_finale': resultats_historique['valeur_portefeuille'][-1],
-                    'onces_finales': resultats_historique['onces_totales'][-1]
+                    'rendement_final': resultats_historique.rendement_pourcent[-1],
+                    'valeur_finale': resultats_historique.valeur_portefeuille[-1],
+                    'onces_finales': resultats_historique.onces_totales[-1]
                 }
                 
             except ValueError as e:
@@ -69,21 +127,17 @@ class HybridDCASimulator:
         print(f"\n🔹 PARTIE 2: PROJECTIONS MONTE CARLO ({nombre_annees} ans)")
         print("-" * 50)
         
-        # Obtenir le prix actuel (2024) comme point de départ
-        df_prix = self.volatility_analyzer.df
-        prix_actuel = df_prix.loc[2024, 'Price']
-        
+        # Le prix actuel (2024) sert de point de départ
         self.monte_carlo_simulator.configure_simulation(
             investissement_annuel=investissement_annuel,
             nombre_annees=nombre_annees,
-            prix_initial=prix_actuel,
+            prix_initial=self.prix_actuel,
             frais_par_once=frais_par_once,
             nb_simulations=nb_simulations_mc,
             period=period_volatility
         )
         
-        resultats_mc = self.monte_carlo_simulator.simuler_dca_monte_carlo()
-        statistiques_mc = self.monte_carlo_simulator.calculer_statistiques(resultats_mc)
+        resultats_mc, statistiques_mc = self._executer_monte_carlo()
         
         self.monte_carlo_simulator.afficher_resultats_monte_carlo(resultats_mc, statistiques_mc)
         
@@ -119,11 +173,11 @@ class HybridDCASimulator:
         if resultats['monte_carlo']:
             mc_stats = resultats['monte_carlo']['statistiques']
             print(f"\nPROJECTIONS MONTE CARLO:")
-            print(f"  Rendement moyen: {mc_stats['rendement_moyen']:8.1f}%")
-            print(f"  Rendement médian: {mc_stats['rendement_median']:8.1f}%")
-            print(f"  Intervalle 90% confiance: [{mc_stats['rendement_p5']:6.1f}% - {mc_stats['rendement_p95']:6.1f}%]")
-            print(f"  Valeur moyenne: {mc_stats['valeur_moyenne']:10,.2f} USD")
-            print(f"  Probabilité de profit: {mc_stats['prob_profit']:6.1f}%")
+            print(f"  Rendement moyen: {mc_stats.rendement_moyen:8.1f}%")
+            print(f"  Rendement médian: {mc_stats.rendement_median:8.1f}%")
+            print(f"  Intervalle 90% confiance: [{mc_stats.rendement_p5:6.1f}% - {mc_stats.rendement_p95:6.1f}%]")
+            print(f"  Valeur moyenne: {mc_stats.valeur_moyenne:10,.2f} USD")
+            print(f"  Probabilité de profit: {mc_stats.prob_profit:6.1f}%")
         
         # Recommandations basées sur l'analyse
         self._generer_recommandations(resultats, investissement_annuel)
@@ -139,10 +193,10 @@ class HybridDCASimulator:
             mc_stats = resultats['monte_carlo']['statistiques']
             
             # Analyse du risque
-            if mc_stats['prob_profit'] > 70:
+            if mc_stats.prob_profit > 70:
                 print("✅ Probabilité de profit élevée (>70%)")
                 print("   → Stratégie DCA recommandée pour ce profil")
-            elif mc_stats['prob_profit'] > 50:
+            elif mc_stats.prob_profit > 50:
                 print("⚠️  Probabilité de profit modérée (50-70%)")
                 print("   → Stratégie DCA acceptable, surveiller la volatilité")
             else:
@@ -150,7 +204,7 @@ class HybridDCASimulator:
                 print("   → Reconsidérer la stratégie ou réduire l'exposition")
             
             # Analyse de la volatilité
-            ecart_rendement = mc_stats['rendement_p95'] - mc_stats['rendement_p5']
+            ecart_rendement = mc_stats.rendement_p95 - mc_stats.rendement_p5
             if ecart_rendement > 200:
                 print("📊 Volatilité très élevée")
                 print("   → Considérer un investissement plus étalé dans le temps")
@@ -170,7 +224,7 @@ class HybridDCASimulator:
                 print("   → S'assurer de la diversification du portefeuille")
             
             # VaR Analysis
-            if abs(mc_stats['var_5pct']) > investissement_annuel * 2:
+            if abs(mc_stats.var_5pct) > investissement_annuel * 2:
                 print("⚠️  VaR élevé - Risque de perte importante")
                 print("   → Considérer une réduction de l'exposition")
     
@@ -184,51 +238,56 @@ class HybridDCASimulator:
         
         periodes = ['Gold_Standard', 'Post_Bretton_Woods', 'Stabilization', 'Modern_Era']
         
-        resultats_comparaison = {}
+        # Paramètres de volatilité lus une seule fois pour toutes les périodes
+        params_periodes = {periode: self.volatility_analyzer.get_monte_carlo_params(periode)
+                           for periode in periodes}
+        
+        # Une configuration par période disponible, simulées ensemble en un seul balayage
+        params_mc = {}
+        for periode in periodes:
+            if 'drift' not in params_periodes[periode]:
+                continue
+            self.monte_carlo_simulator.configure_simulation(
+                investissement_annuel=investissement_annuel,
+                nombre_annees=nombre_annees,
+                prix_initial=self.prix_actuel,
+                nb_simulations=1000,
+                period=periode
+            )
+            params_mc[periode] = self.monte_carlo_simulator.parametres()
+        resultats_lot = self._executer_monte_carlo_lot(list(params_mc.values()))
+        
+        # Lignes du tableau récapitulatif, construites pendant le parcours des périodes
+        lignes_tableau = []
         
         for periode in periodes:
             print(f"\n🔸 Analyse période: {periode.replace('_', ' ')}")
             
             # Obtenir les paramètres de volatilité
-            params = self.volatility_analyzer.get_monte_carlo_params(periode)
+            params = params_periodes[periode]
             if 'drift' not in params:
                 continue
             
             print(f"   Drift: {params['drift']:.3f} ({params['drift']*100:.1f}%)")
             print(f"   Volatilité: {params['volatility']:.3f} ({params['volatility']*100:.1f}%)")
             
-            # Configurer et exécuter Monte Carlo
-            df_prix = self.volatility_analyzer.df
-            prix_actuel = df_prix.loc[2024, 'Price']
-            
-            self.monte_carlo_simulator.configure_simulation(
-                investissement_annuel=investissement_annuel,
-                nombre_annees=nombre_annees,
-                prix_initial=prix_actuel,
-                nb_simulations=1000,
-                period=periode
-            )
-            
-            resultats_mc = self.monte_carlo_simulator.simuler_dca_monte_carlo()
-            stats_mc = self.monte_carlo_simulator.calculer_statistiques(resultats_mc)
+            resultats_mc, stats_mc = resultats_lot[params_mc[periode]]
             
-            resultats_comparaison[periode] = stats_mc
+            lignes_tableau.append(f"{periode.replace('_', ' '):<20} "
+                                  f"{stats_mc.rendement_moyen:<9.1f}% "
+                                  f"{stats_mc.prob_profit:<11.1f}% "
+                                  f"{stats_mc.var_5pct:<11,.0f} "
+                                  f"{params['volatility']*100:<9.1f}%")
             
-            print(f"   Rendement moyen: {stats_mc['rendement_moyen']:6.1f}%")
-            print(f"   Probabilité profit: {stats_mc['prob_profit']:6.1f}%")
-            print(f"   VaR 5%: {stats_mc['var_5pct']:,.0f} USD")
+            print(f"   Rendement moyen: {stats_mc.rendement_moyen:6.1f}%")
+            print(f"   Probabilité profit: {stats_mc.prob_profit:6.1f}%")
+            print(f"   VaR 5%: {stats_mc.var_5pct:,.0f} USD")
         
         # Tableau de comparaison
         print(f"\n{'Période':<20} {'Rend.Moy':<10} {'Prob.Profit':<12} {'VaR 5%':<12} {'Volatilité':<10}")
         print("-" * 70)
-        
-        for periode, stats in resultats_comparaison.items():
-            params = self.volatility_analyzer.get_monte_carlo_params(periode)
-            print(f"{periode.replace('_', ' '):<20} "
-                  f"{stats['rendement_moyen']:<9.1f}% "
-                  f"{stats['prob_profit']:<11.1f}% "
-                  f"{stats['var_5pct']:<11,.0f} "
-                  f"{params['volatility']*100:<9.1f}%")
+        if lignes_tableau:
+            print("\n".join(lignes_tableau))
     
     def creer_graphique_comparaison(self, resultats: dict):
         """
@@ -238,15 +297,20 @@ class HybridDCASimulator:
             print("Données insuffisantes pour créer le graphique de comparaison")
             return
         
+        import matplotlib.pyplot as plt
+        
         fig, axes = plt.subplots(1, 2, figsize=(15, 6))
         fig.suptitle('Comparaison Historique vs Monte Carlo', fontsize=16, fontweight='bold')
         
+        # Moyennes déjà calculées avec les statistiques Monte Carlo (pas de nouveau passage)
+        statistiques_mc = resultats['monte_carlo']['statistiques']
+        
         # Graphique 1: Comparaison des rendements
         hist_rendement = resultats['historique']['rendement_final']
         mc_rendements = resultats['monte_carlo']['resultats']['rendements_finaux']
         
         axes[0].hist(mc_rendements, bins=50, alpha=0.7, color='blue', 
-                    label=f'Monte Carlo (moyenne: {np.mean(mc_rendements):.1f}%)')
+                    label=f'Monte Carlo (moyenne: {statistiques_mc.rendement_moyen:.1f}%)')
         axes[0].axvline(hist_rendement, color='red', linewidth=3, 
                        label=f'Historique: {hist_rendement:.1f}%')
         axes[0].set_title('Distribution des Rendements')
@@ -260,7 +324,7 @@ class HybridDCASimulator:
         mc_valeurs = resultats['monte_carlo']['resultats']['valeurs_finales']
         
         axes[1].hist(mc_valeurs, bins=50, alpha=0.7, color='green',
-                    label=f'Monte Carlo (moyenne: {np.mean(mc_valeurs):,.0f}$)')
+                    label=f'Monte Carlo (moyenne: {statistiques_mc.valeur_moyenne:,.0f}$)')
         axes[1].axvline(hist_valeur, color='red', linewidth=3,
                        label=f'Historique: {hist_valeur:,.0f}$')
         axes[1].set_title('Distribution des Valeurs Finales')
@@ -3,13 +3,356 @@ Simulation Monte Carlo pour l'investissement DCA sur l'or
 Combine la stratégie DCA avec des simulations de prix aléatoires
 """
 
-import pandas as pd
+import os
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, List
+from dca_simulation import appliquer_style_graphiques
 from volatility_analysis import GoldVolatilityAnalysis
+from monte_carlo_kernel import NUMBA_DISPONIBLE, mc_paths
+
+# Au-delà de ce nombre de simulations (et sans Numba), le calcul est réparti entre processus
+SEUIL_SIMULATIONS_PARALLELES = 200_000
+
+# Nombre maximal de trajectoires régénérées pour les graphiques (échantillon et bandes)
+TAILLE_ECHANTILLON_GRAPHIQUES = 10_000
+
+# Lignes de chocs tirées par bloc lors d'une régénération partielle
+TAILLE_BLOC_CHOCS = 8192
+
+@dataclass(frozen=True)
+class SimParams:
+    """
+    Paramètres immuables d'une simulation Monte Carlo DCA
+    
+    Transmissibles tels quels à un autre processus (ProcessPoolExecutor)
+    """
+    investissement_annuel: float
+    nombre_annees: int
+    prix_initial: float
+    frais_par_once: float = 25.0
+    nb_simulations: int = 1000
+    drift: float = 0.05        # Rendement moyen annuel
+    volatility: float = 0.20   # Volatilité annuelle
+    seed: int = 42             # Graine du générateur (reproductibilité)
+    store_paths: bool = False  # Conserver la matrice des trajectoires (graphiques)
+
+@dataclass(slots=True)
+class MCStats:
+    """
+    Statistiques agrégées d'une simulation Monte Carlo DCA
+    """
+    rendement_moyen: float
+    rendement_median: float
+    rendement_std: float
+    rendement_min: float
+    rendement_max: float
+    rendement_p5: float
+    rendement_p25: float
+    rendement_p75: float
+    rendement_p95: float
+    valeur_moyenne: float
+    valeur_mediane: float
+    valeur_p5: float
+    valeur_p95: float
+    prob_profit: float
+    prob_perte: float
+    prob_rendement_positif: float
+    var_5pct: float
+    var_1pct: float
+    
+    def __getitem__(self, cle: str) -> float:
+        # Compatibilité avec l'ancien accès par clé (statistiques['prob_profit'])
+        return getattr(self, cle)
+
+def _creer_generateur(seed: int) -> np.random.Generator:
+    """
+    Crée un générateur SFC64 (tirages normaux plus rapides que PCG64/MT19937)
+    """
+    return np.random.Generator(np.random.SFC64(seed))
+
+def _generer_chocs(params: SimParams) -> np.ndarray:
+    """
+    Génère les chocs aléatoires N(0, 1) de forme (nb_simulations, nombre_annees - 1)
+    
+    Utilise un générateur SFC64 propre à chaque appel plutôt que l'état global
+    de np.random : plus rapide, et sans interférence entre simulations.
+    Les tirages sont en float32 (précision largement suffisante pour le Monte
+    Carlo, et deux fois moins de mémoire à parcourir pour exp et cumsum).
+    
+    Variables antithétiques : seule la première moitié des lignes est tirée,
+    la seconde en est l'opposé (moitié moins de tirages, variance réduite).
+    """
+    rng = _creer_generateur(params.seed)
+    moitie = (params.nb_simulations + 1) // 2
+    chocs = np.empty((params.nb_simulations, params.nombre_annees - 1), dtype=np.float32)
+    rng.standard_normal(out=chocs[:moitie], dtype=np.float32)
+    np.negative(chocs[:params.nb_simulations - moitie], out=chocs[moitie:])
+    return chocs
+
+def _chocs_lignes(params: SimParams, lignes: np.ndarray) -> np.ndarray:
+    """
+    Reproduit certaines lignes des chocs de _generer_chocs (même graine), en tirant
+    le flux bloc par bloc sans jamais matérialiser la matrice complète
+    
+    Returns:
+        Array float32 de forme (len(lignes), nombre_annees - 1)
+    """
+    moitie = (params.nb_simulations + 1) // 2
+    chocs = np.empty((len(lignes), params.nombre_annees - 1), dtype=np.float32)
+    if len(lignes) == 0:
+        return chocs
+    
+    # Une ligne de la seconde moitié est l'opposée de la ligne tirée i - moitie
+    sources = np.where(lignes < moitie, lignes, lignes - moitie)
+    rng = _creer_generateur(params.seed)
+    bloc = np.empty((min(TAILLE_BLOC_CHOCS, moitie), params.nombre_annees - 1), dtype=np.float32)
+    fin = int(sources.max()) + 1
+    for debut in range(0, fin, len(bloc)):
+        n = min(len(bloc), fin - debut)
+        rng.standard_normal(out=bloc[:n], dtype=np.float32)
+        dans_bloc = (sources >= debut) & (sources < debut + n)
+        chocs[dans_bloc] = bloc[sources[dans_bloc] - debut]
+    np.negative(chocs, out=chocs, where=(lignes >= moitie)[:, None])
+    return chocs
+
+def generer_trajectoires_prix(params: SimParams) -> np.ndarray:
+    """
+    Génère des trajectoires de prix aléatoires en utilisant le modèle géométrique brownien
+    
+    Returns:
+        Array float32 de forme (nb_simulations, nombre_annees) contenant les prix simulés
+    """
+    return _trajectoires_depuis_chocs(params, _generer_chocs(params))
+
+def _trajectoires_depuis_chocs(params: SimParams, chocs_aleatoires: np.ndarray) -> np.ndarray:
+    """
+    Construit une trajectoire de prix par ligne de chocs (modèle géométrique brownien)
+    """
+    # Paramètres en float32 pour que tout le pipeline cumsum/exp reste en float32
+    drift = np.float32(params.drift)
+    volatility = np.float32(params.volatility)
+    
+    # Modèle géométrique brownien, avec dt = 1 an :
+    # log S(t) = log S(0) + somme des incréments (drift - 0.5*vol²) + vol*epsilon
+    # Tout est calculé en place dans le buffer final (aucune matrice temporaire)
+    prix_simules = np.zeros((len(chocs_aleatoires), params.nombre_annees), dtype=np.float32)
+    increments = prix_simules[:, 1:]
+    np.multiply(chocs_aleatoires, volatility, out=increments)
+    increments += drift - np.float32(0.5) * volatility**2
+    np.cumsum(increments, axis=1, out=increments)
+    np.exp(prix_simules, out=prix_simules)
+    prix_simules *= np.float32(params.prix_initial)
+    
+    return prix_simules
+
+def _simuler_numba(params: SimParams) -> Dict:
+    """
+    Variante de simuler utilisant le noyau compilé mc_paths
+    (trajectoires et accumulation DCA fusionnées, parallélisées par simulation)
+    """
+    prix_trajectoires, onces_finales, valeurs_finales, profits_finaux, rendements_finaux = mc_paths(
+        float(params.investissement_annuel), float(params.prix_initial),
+        float(params.frais_par_once), float(params.drift), float(params.volatility),
+        _generer_chocs(params), params.store_paths
+    )
+    
+    return {
+        'valeurs_finales': valeurs_finales,
+        'rendements_finaux': rendements_finaux,
+        'onces_finales': onces_finales,
+        'investissement_total': params.investissement_annuel * params.nombre_annees,
+        'prix_trajectoires': prix_trajectoires if params.store_paths else None,
+        'profits_finaux': profits_finaux
+    }
+
+def _simuler_numpy(params: SimParams) -> Dict:
+    """
+    Variante de simuler en NumPy vectorisé (sans Numba), dans le processus courant
+    """
+    # Générer les trajectoires de prix
+    prix_trajectoires = generer_trajectoires_prix(params)
+    
+    prix_finaux = prix_trajectoires[:, -1].astype(np.float64)
+    
+    # Inverses des prix en une seule passe float32 ; si les trajectoires ne sont
+    # pas conservées, calculées en place pour éviter une seconde matrice
+    if params.store_paths:
+        inverses_prix = np.reciprocal(prix_trajectoires)
+    else:
+        inverses_prix = np.reciprocal(prix_trajectoires, out=prix_trajectoires)
+    
+    # Accumulation DCA vectorisée : onces = investissement * somme(1 / prix)
+    # (agrégats repassés en float64 pour les statistiques)
+    onces_finales = params.investissement_annuel * inverses_prix.sum(axis=1, dtype=np.float64)
+    
+    # Valeur brute au prix final, moins les frais sur toutes les onces détenues
+    valeur_brute = onces_finales * prix_finaux
+    frais_totaux = onces_finales * params.frais_par_once * params.nombre_annees
+    valeurs_finales = valeur_brute - frais_totaux
+    
+    # Calculer le profit et le rendement
+    investissement_total = params.investissement_annuel * params.nombre_annees
+    profits_finaux = valeurs_finales - investissement_total
+    
+    resultats = {
+        'valeurs_finales': valeurs_finales,
+        'rendements_finaux': (profits_finaux / investissement_total) * 100,
+        'onces_finales': onces_finales,
+        'investissement_total': investissement_total,
+        'prix_trajectoires': prix_trajectoires if params.store_paths else None,
+        'profits_finaux': profits_finaux
+    }
+    
+    return resultats
+
+def _decouper_paquets(params: SimParams) -> List[SimParams]:
+    """
+    Paquets de simulations tels que simuler les exécute (un seul, sauf pour les
+    très grands tirages NumPy répartis entre processus)
+    
+    Chaque paquet reçoit sa propre graine, dérivée de params.seed par
+    SeedSequence, pour que les flux aléatoires des processus soient indépendants.
+    """
+    if NUMBA_DISPONIBLE or params.nb_simulations <= SEUIL_SIMULATIONS_PARALLELES:
+        return [params]
+    nb_paquets = min(os.cpu_count() or 1, params.nb_simulations)
+    if nb_paquets == 1:
+        return [params]
+    
+    tailles = np.diff(np.linspace(0, params.nb_simulations, nb_paquets + 1).astype(int))
+    graines = np.random.SeedSequence(params.seed).generate_state(nb_paquets)
+    return [replace(params, nb_simulations=int(taille), seed=int(graine))
+            for taille, graine in zip(tailles, graines)]
+
+def _regenerer_trajectoires(params: SimParams, lignes: np.ndarray) -> np.ndarray:
+    """
+    Recalcule certaines trajectoires (indices de simulation) d'un tirage déjà
+    exécuté par simuler : mêmes paquets et mêmes graines, donc mêmes chocs
+    
+    Returns:
+        Array float32 de forme (len(lignes), nombre_annees)
+    """
+    trajectoires = np.empty((len(lignes), params.nombre_annees), dtype=np.float32)
+    debut = 0
+    for paquet in _decouper_paquets(params):
+        dans_paquet = (lignes >= debut) & (lignes < debut + paquet.nb_simulations)
+        if dans_paquet.any():
+            chocs = _chocs_lignes(paquet, lignes[dans_paquet] - debut)
+            trajectoires[dans_paquet] = _trajectoires_depuis_chocs(paquet, chocs)
+        debut += paquet.nb_simulations
+    return trajectoires
+
+def _simuler_parallele(params: SimParams) -> Dict:
+    """
+    Variante de simuler répartissant les simulations entre processus (sans Numba)
+    """
+    paquets = _decouper_paquets(params)
+    nb_paquets = len(paquets)
+    if nb_paquets == 1:
+        return _simuler_numpy(params)
+    
+    with ProcessPoolExecutor(max_workers=nb_paquets) as executor:
+        morceaux = list(executor.map(_simuler_numpy, paquets))
+    
+    resultats = {
+        cle: np.concatenate([morceau[cle] for morceau in morceaux])
+        for cle in ('valeurs_finales', 'rendements_finaux', 'onces_finales', 'profits_finaux')
+    }
+    resultats['investissement_total'] = morceaux[0]['investissement_total']
+    resultats['prix_trajectoires'] = (
+        np.concatenate([morceau['prix_trajectoires'] for morceau in morceaux])
+        if params.store_paths else None
+    )
+    return resultats
+
+def simuler(params: SimParams) -> Dict:
+    """
+    Exécute une simulation DCA Monte Carlo (fonction pure, sans état partagé)
+    
+    Returns:
+        Dictionnaire contenant les résultats de toutes les simulations
+        ('prix_trajectoires' vaut None si params.store_paths est False ;
+        'parametres' permet alors de régénérer des trajectoires du même tirage)
+    """
+    if NUMBA_DISPONIBLE:
+        resultats = _simuler_numba(params)
+    elif params.nb_simulations > SEUIL_SIMULATIONS_PARALLELES:
+        resultats = _simuler_parallele(params)
+    else:
+        resultats = _simuler_numpy(params)
+    resultats['parametres'] = params
+    return resultats
+
+def simuler_lot(liste_params: List[SimParams]) -> List[Dict]:
+    """
+    Exécute en un seul calcul vectorisé un balayage de simulations
+    (prix initial, frais, investissement, durée, drift ou volatilité variables)
+    
+    Les paramètres doivent partager nb_simulations et seed : les chocs aléatoires sont
+    tirés une seule fois pour la durée maximale (chocs communs à tous les points)
+    et les trajectoires relatives S(t)/S(0) sont calculées une fois par couple
+    (drift, volatility) distinct, tous couples diffusés en un seul passage.
+    
+    Returns:
+        Liste de dictionnaires de résultats, dans l'ordre de liste_params
+    """
+    reference = liste_params[0]
+    if any(params.nb_simulations != reference.nb_simulations for params in liste_params):
+        raise ValueError("Le balayage doit partager nb_simulations")
+    if any(params.seed != reference.seed for params in liste_params):
+        raise ValueError("Le balayage doit partager seed")
+    
+    duree_max = max(params.nombre_annees for params in liste_params)
+    chocs_aleatoires = _generer_chocs(replace(reference, nombre_annees=duree_max))
+    
+    # Couples (drift, volatility) distincts et couple associé à chaque point du balayage
+    couples = list(dict.fromkeys((p.drift, p.volatility) for p in liste_params))
+    indices_couples = np.array([couples.index((p.drift, p.volatility)) for p in liste_params])
+    volatilites = np.array([vol for _, vol in couples], dtype=np.float32)[:, None, None]
+    derives = np.array([drift - 0.5 * vol**2 for drift, vol in couples], dtype=np.float32)[:, None, None]
+    
+    # Facteurs de croissance S(t)/S(0) = exp(somme cumulée des log-rendements),
+    # de forme (couples, nb_simulations, duree_max), calculés en place (float32)
+    facteurs = np.zeros((len(couples), reference.nb_simulations, duree_max), dtype=np.float32)
+    log_rendements = facteurs[:, :, 1:]
+    np.multiply(chocs_aleatoires, volatilites, out=log_rendements)
+    log_rendements += derives
+    np.cumsum(log_rendements, axis=2, out=log_rendements)
+    np.exp(facteurs, out=facteurs)
+    inverses_cumules = np.reciprocal(facteurs)
+    np.cumsum(inverses_cumules, axis=2, out=inverses_cumules)
+    
+    # Paramètres du balayage en vecteurs, diffusés sur l'axe des simulations
+    investissements = np.array([p.investissement_annuel for p in liste_params], dtype=np.float64)
+    prix_initiaux = np.array([p.prix_initial for p in liste_params], dtype=np.float64)
+    frais = np.array([p.frais_par_once for p in liste_params], dtype=np.float64)
+    durees = np.array([p.nombre_annees for p in liste_params])
+    derniere_annee = durees - 1
+    
+    # Onces = somme des investissement / prix, valeur nette à la dernière année
+    onces_finales = (investissements / prix_initiaux) * inverses_cumules[indices_couples, :, derniere_annee].T
+    prix_finaux = prix_initiaux * facteurs[indices_couples, :, derniere_annee].T
+    valeurs_finales = onces_finales * prix_finaux - onces_finales * frais * durees
+    profits_finaux = valeurs_finales - investissements * durees
+    rendements_finaux = profits_finaux / (investissements * durees) * 100
+    
+    return [
+        {
+            'valeurs_finales': valeurs_finales[:, k],
+            'rendements_finaux': rendements_finaux[:, k],
+            'onces_finales': onces_finales[:, k],
+            'investissement_total': params.investissement_annuel * params.nombre_annees,
+            'prix_trajectoires': (params.prix_initial * facteurs[indices_couples[k], :, :params.nombre_annees]
+                                  if params.store_paths else None),
+            'profits_finaux': profits_finaux[:, k],
+            'parametres': params,
+            # Tirage unique sur la durée maximale, non découpé en paquets
+            'parametres_tirage': replace(params, nombre_annees=duree_max)
+        }
+        for k, params in enumerate(liste_params)
+    ]
 
 class MonteCarloGoldDCA:
     def __init__(self, data_file: str = "data/annual.csv"):
@@ -30,27 +373,59 @@ class MonteCarloGoldDCA:
         self.drift = 0.05  # Rendement moyen annuel
         self.volatility = 0.20  # Volatilité annuelle
         
+        # Graine et générateur SFC64 propres à l'instance (pas d'état global np.random)
+        self.seed = 42
+        self._rng = _creer_generateur(self.seed)
+        
+        # Trajectoires non conservées par défaut (statistiques seules)
+        self.store_paths = False
+        
     def configure_simulation(self, 
                            investissement_annuel: float,
                            nombre_annees: int,
                            prix_initial: float,
                            frais_par_once: float = 25.0,
                            nb_simulations: int = 1000,
-                           period: str = 'Modern_Era'):
+                           period: str = 'Modern_Era',
+                           seed: int = 42,
+                           store_paths: bool = False):
         """
         Configure les paramètres de simulation Monte Carlo
+        
+        Args:
+            seed: Graine du générateur aléatoire, à faire varier entre deux tirages
+            store_paths: Conserver la matrice (nb_simulations, nombre_annees) des prix
         """
         self.investissement_annuel = investissement_annuel
         self.nombre_annees = nombre_annees
         self.prix_initial = prix_initial
         self.frais_par_once = frais_par_once
         self.nb_simulations = nb_simulations
+        self.seed = seed
+        self._rng = _creer_generateur(seed)
+        self.store_paths = store_paths
         
         # Obtenir les paramètres historiques pour la période choisie
         mc_params = self.volatility_analyzer.get_monte_carlo_params(period)
         self.drift = mc_params.get('drift', 0.05)
         self.volatility = mc_params.get('volatility', 0.20)
         
+    def parametres(self) -> SimParams:
+        """
+        Retourne un instantané immuable des paramètres de simulation courants
+        """
+        return SimParams(
+            investissement_annuel=self.investissement_annuel,
+            nombre_annees=self.nombre_annees,
+            prix_initial=self.prix_initial,
+            frais_par_once=self.frais_par_once,
+            nb_simulations=self.nb_simulations,
+            drift=self.drift,
+            volatility=self.volatility,
+            seed=self.seed,
+            store_paths=self.store_paths
+        )
+    
     def generer_trajectoires_prix(self) -> np.ndarray:
         """
         Génère des trajectoires de prix aléatoires en utilisant le modèle géométrique brownien
@@ -58,80 +433,21 @@ class MonteCarloGoldDCA:
         Returns:
             Array de forme (nb_simulations, nombre_annees) contenant les prix simulés
         """
-        # Initialiser l'array des prix
-        prix_simules = np.zeros((self.nb_simulations, self.nombre_annees))
-        prix_simules[:, 0] = self.prix_initial
-        
-        # Générer les chocs aléatoires
-        np.random.seed(42)  # Pour reproductibilité
-        chocs_aleatoires = np.random.normal(0, 1, (self.nb_simulations, self.nombre_annees - 1))
-        
-        # Calculer les trajectoires de prix (modèle géométrique brownien)
-        for t in range(1, self.nombre_annees):
-            # Formule: S(t+1) = S(t) * exp((drift - 0.5*vol²)*dt + vol*sqrt(dt)*epsilon)
-            # Avec dt = 1 an
-            prix_simules[:, t] = prix_simules[:, t-1] * np.exp(
-                (self.drift - 0.5 * self.volatility**2) + 
-                self.volatility * chocs_aleatoires[:, t-1]
-            )
-        
-        return prix_simules
+        return generer_trajectoires_prix(self.parametres())
     
-    def simuler_dca_monte_carlo(self) -> Dict:
+    def simuler_dca_monte_carlo(self, params: SimParams = None) -> Dict:
         """
         Exécute la simulation DCA Monte Carlo
         
+        Args:
+            params: Paramètres explicites ; par défaut ceux de configure_simulation
+        
         Returns:
             Dictionnaire contenant les résultats de toutes les simulations
         """
-        # Générer les trajectoires de prix
-        prix_trajectoires = self.generer_trajectoires_prix()
-        
-        # Initialiser les arrays de résultats
-        resultats = {
-            'valeurs_finales': np.zeros(self.nb_simulations),
-            'rendements_finaux': np.zeros(self.nb_simulations),
-            'onces_finales': np.zeros(self.nb_simulations),
-            'investissement_total': self.investissement_annuel * self.nombre_annees,
-            'prix_trajectoires': prix_trajectoires,
-            'profits_finaux': np.zeros(self.nb_simulations)
-        }
-        
-        # Simuler chaque trajectoire
-        for sim in range(self.nb_simulations):
-            onces_totales = 0.0
-            
-            # Pour chaque année de la simulation
-            for annee in range(self.nombre_annees):
-                prix_actuel = prix_trajectoires[sim, annee]
-                
-                # Acheter des onces avec l'investissement annuel
-                onces_achetees = self.investissement_annuel / prix_actuel
-                onces_totales += onces_achetees
-            
-            # Calculer la valeur finale du portefeuille
-            prix_final = prix_trajectoires[sim, -1]
-            valeur_brute = onces_totales * prix_final
-            
-            # Calculer les frais totaux
-            frais_totaux = onces_totales * self.frais_par_once * self.nombre_annees
-            
-            # Valeur nette
-            valeur_finale = valeur_brute - frais_totaux
-            
-            # Calculer le profit et le rendement
-            profit_final = valeur_finale - resultats['investissement_total']
-            rendement_final = (profit_final / resultats['investissement_total']) * 100
-            
-            # Stocker les résultats
-            resultats['valeurs_finales'][sim] = valeur_finale
-            resultats['rendements_finaux'][sim] = rendement_final
-            resultats['onces_finales'][sim] = onces_totales
-            resultats['profits_finaux'][sim] = profit_final
-        
-        return resultats
+        return simuler(params if params is not None else self.parametres())
     
-    def calculer_statistiques(self, resultats: Dict) -> Dict:
+    def calculer_statistiques(self, resultats: Dict) -> MCStats:
         """
         Calcule les statistiques sur les résultats Monte Carlo
         """
@@ -139,39 +455,42 @@ class MonteCarloGoldDCA:
         valeurs = resultats['valeurs_finales']
         profits = resultats['profits_finaux']
         
-        stats_dict = {
+        # Un seul passage de partition par array pour tous ses quantiles
+        r_p5, r_p25, r_median, r_p75, r_p95 = np.quantile(rendements, [0.05, 0.25, 0.5, 0.75, 0.95])
+        v_p5, v_median, v_p95 = np.quantile(valeurs, [0.05, 0.5, 0.95])
+        p_p1, p_p5 = np.quantile(profits, [0.01, 0.05])
+        
+        return MCStats(
             # Statistiques sur les rendements
-            'rendement_moyen': np.mean(rendements),
-            'rendement_median': np.median(rendements),
-            'rendement_std': np.std(rendements),
-            'rendement_min': np.min(rendements),
-            'rendement_max': np.max(rendements),
+            rendement_moyen=np.mean(rendements),
+            rendement_median=r_median,
+            rendement_std=np.std(rendements),
+            rendement_min=np.min(rendements),
+            rendement_max=np.max(rendements),
             
             # Percentiles des rendements
-            'rendement_p5': np.percentile(rendements, 5),
-            'rendement_p25': np.percentile(rendements, 25),
-            'rendement_p75': np.percentile(rendements, 75),
-            'rendement_p95': np.percentile(rendements, 95),
+            rendement_p5=r_p5,
+            rendement_p25=r_p25,
+            rendement_p75=r_p75,
+            rendement_p95=r_p95,
             
             # Statistiques sur les valeurs finales
-            'valeur_moyenne': np.mean(valeurs),
-            'valeur_mediane': np.median(valeurs),
-            'valeur_p5': np.percentile(valeurs, 5),
-            'valeur_p95': np.percentile(valeurs, 95),
+            valeur_moyenne=np.mean(valeurs),
+            valeur_mediane=v_median,
+            valeur_p5=v_p5,
+            valeur_p95=v_p95,
             
             # Probabilités
-            'prob_profit': np.mean(profits > 0) * 100,
-            'prob_perte': np.mean(profits < 0) * 100,
-            'prob_rendement_positif': np.mean(rendements > 0) * 100,
+            prob_profit=np.mean(profits > 0) * 100,
+            prob_perte=np.mean(profits < 0) * 100,
+            prob_rendement_positif=np.mean(rendements > 0) * 100,
             
             # Value at Risk (VaR)
-            'var_5pct': np.percentile(profits, 5),
-            'var_1pct': np.percentile(profits, 1),
-        }
-        
-        return stats_dict
+            var_5pct=p_p5,
+            var_1pct=p_p1,
+        )
     
-    def afficher_resultats_monte_carlo(self, resultats: Dict, statistiques: Dict):
+    def afficher_resultats_monte_carlo(self, resultats: Dict, statistiques: MCStats):
         """
         Affiche les résultats de la simulation Monte Carlo
         """
@@ -193,47 +512,74 @@ class MonteCarloGoldDCA:
         print("\n" + "="*50)
         print("STATISTIQUES DES RENDEMENTS")
         print("="*50)
-        print(f"Rendement moyen: {statistiques['rendement_moyen']:8.1f}%")
-        print(f"Rendement médian: {statistiques['rendement_median']:8.1f}%")
-        print(f"Écart-type: {statistiques['rendement_std']:8.1f}%")
-        print(f"Minimum: {statistiques['rendement_min']:8.1f}%")
-        print(f"Maximum: {statistiques['rendement_max']:8.1f}%")
+        print(f"Rendement moyen: {statistiques.rendement_moyen:8.1f}%")
+        print(f"Rendement médian: {statistiques.rendement_median:8.1f}%")
+        print(f"Écart-type: {statistiques.rendement_std:8.1f}%")
+        print(f"Minimum: {statistiques.rendement_min:8.1f}%")
+        print(f"Maximum: {statistiques.rendement_max:8.1f}%")
         
         print(f"\nINTERVALLES DE CONFIANCE:")
-        print(f"5e percentile: {statistiques['rendement_p5']:8.1f}%")
-        print(f"25e percentile: {statistiques['rendement_p25']:8.1f}%")
-        print(f"75e percentile: {statistiques['rendement_p75']:8.1f}%")
-        print(f"95e percentile: {statistiques['rendement_p95']:8.1f}%")
+        print(f"5e percentile: {statistiques.rendement_p5:8.1f}%")
+        print(f"25e percentile: {statistiques.rendement_p25:8.1f}%")
+        print(f"75e percentile: {statistiques.rendement_p75:8.1f}%")
+        print(f"95e percentile: {statistiques.rendement_p95:8.1f}%")
         
         print(f"\nPROBABILITÉS:")
-        print(f"Probabilité de profit: {statistiques['prob_profit']:6.1f}%")
-        print(f"Probabilité de perte: {statistiques['prob_perte']:6.1f}%")
-        print(f"Probabilité rendement > 0%: {statistiques['prob_rendement_positif']:6.1f}%")
+        print(f"Probabilité de profit: {statistiques.prob_profit:6.1f}%")
+        print(f"Probabilité de perte: {statistiques.prob_perte:6.1f}%")
+        print(f"Probabilité rendement > 0%: {statistiques.prob_rendement_positif:6.1f}%")
         
         print(f"\nVALUE AT RISK:")
-        print(f"VaR 5%: {statistiques['var_5pct']:,.2f} USD")
-        print(f"VaR 1%: {statistiques['var_1pct']:,.2f} USD")
+        print(f"VaR 5%: {statistiques.var_5pct:,.2f} USD")
+        print(f"VaR 1%: {statistiques.var_1pct:,.2f} USD")
         
         print(f"\nVALEURS FINALES:")
-        print(f"Valeur moyenne: {statistiques['valeur_moyenne']:,.2f} USD")
-        print(f"Valeur médiane: {statistiques['valeur_mediane']:,.2f} USD")
-        print(f"Intervalle 90% confiance: [{statistiques['valeur_p5']:,.0f} - {statistiques['valeur_p95']:,.0f}] USD")
+        print(f"Valeur moyenne: {statistiques.valeur_moyenne:,.2f} USD")
+        print(f"Valeur médiane: {statistiques.valeur_mediane:,.2f} USD")
+        print(f"Intervalle 90% confiance: [{statistiques.valeur_p5:,.0f} - {statistiques.valeur_p95:,.0f}] USD")
     
-    def creer_graphiques_monte_carlo(self, resultats: Dict, statistiques: Dict):
+    def creer_graphiques_monte_carlo(self, resultats: Dict, statistiques: MCStats):
         """
         Crée des graphiques pour visualiser les résultats Monte Carlo
         """
-        plt.style.use('seaborn-v0_8')
+        # Paramètres du tirage qui a produit ces résultats (pas ceux de l'instance,
+        # qui ont pu être reconfigurés depuis)
+        params = resultats['parametres']
+        annees = range(params.nombre_annees)
+        
+        # Sous-échantillon borné de simulations pour les trajectoires et les bandes ;
+        # si elles n'ont pas été conservées, seules ces lignes sont régénérées
+        # (mêmes paquets, mêmes graines et mêmes chocs que le tirage d'origine)
+        # Tirage des indices en O(taille) avec integers() (les trajectoires sont i.i.d.,
+        # un doublon est sans effet) ; tout le tirage s'il tient dans l'échantillon
+        if params.nb_simulations <= TAILLE_ECHANTILLON_GRAPHIQUES:
+            lignes = np.arange(params.nb_simulations)
+        else:
+            lignes = self._rng.integers(0, params.nb_simulations, TAILLE_ECHANTILLON_GRAPHIQUES)
+        if resultats['prix_trajectoires'] is not None:
+            prix_trajectoires = resultats['prix_trajectoires'][lignes]
+        elif 'parametres_tirage' in resultats:
+            tirage = resultats['parametres_tirage']
+            prix_trajectoires = _trajectoires_depuis_chocs(
+                tirage, _chocs_lignes(tirage, lignes))[:, :params.nombre_annees]
+        else:
+            prix_trajectoires = _regenerer_trajectoires(params, lignes)
+        
+        import matplotlib.pyplot as plt
+        appliquer_style_graphiques()
         fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle(f'Simulation Monte Carlo - DCA Or ({self.nb_simulations:,} simulations)', 
+        fig.suptitle(f'Simulation Monte Carlo - DCA Or ({params.nb_simulations:,} simulations)', 
                     fontsize=16, fontweight='bold')
         
         # 1. Distribution des rendements finaux
-        axes[0, 0].hist(resultats['rendements_finaux'], bins=50, alpha=0.7, color='blue', edgecolor='black')
-        axes[0, 0].axvline(statistiques['rendement_moyen'], color='red', linestyle='--', 
-                          label=f'Moyenne: {statistiques["rendement_moyen"]:.1f}%')
-        axes[0, 0].axvline(statistiques['rendement_median'], color='green', linestyle='--',
-                          label=f'Médiane: {statistiques["rendement_median"]:.1f}%')
+        # Histogrammes binnés par NumPy puis tracés en barres (pas de hist() matplotlib)
+        effectifs, bords = np.histogram(resultats['rendements_finaux'], bins=50)
+        axes[0, 0].bar(bords[:-1], effectifs, width=np.diff(bords), align='edge',
+                       alpha=0.7, color='blue', edgecolor='black')
+        axes[0, 0].axvline(statistiques.rendement_moyen, color='red', linestyle='--', 
+                          label=f'Moyenne: {statistiques.rendement_moyen:.1f}%')
+        axes[0, 0].axvline(statistiques.rendement_median, color='green', linestyle='--',
+                          label=f'Médiane: {statistiques.rendement_median:.1f}%')
         axes[0, 0].set_title('Distribution des Rendements Finaux')
         axes[0, 0].set_xlabel('Rendement (%)')
         axes[0, 0].set_ylabel('Fréquence')
@@ -241,35 +587,35 @@ class MonteCarloGoldDCA:
         axes[0, 0].grid(True, alpha=0.3)
         
         # 2. Trajectoires de prix (échantillon)
-        sample_trajectories = np.random.choice(self.nb_simulations, min(100, self.nb_simulations), replace=False)
-        for i in sample_trajectories:
-            axes[0, 1].plot(range(self.nombre_annees), resultats['prix_trajectoires'][i], 
-                           alpha=0.1, color='gray', linewidth=0.5)
+        # 100 trajectoires de l'échantillon, tirées elles aussi avec integers()
+        sample_trajectories = self._rng.integers(0, len(lignes), min(100, len(lignes)))
+        axes[0, 1].plot(annees, prix_trajectoires[sample_trajectories].T, 
+                       alpha=0.1, color='gray', linewidth=0.5)
         
-        # Trajectoire moyenne
-        prix_moyen = np.mean(resultats['prix_trajectoires'], axis=0)
-        axes[0, 1].plot(range(self.nombre_annees), prix_moyen, color='red', linewidth=3, 
+        # Trajectoire moyenne (sur l'échantillon)
+        prix_moyen = np.mean(prix_trajectoires, axis=0)
+        axes[0, 1].plot(annees, prix_moyen, color='red', linewidth=3, 
                        label='Trajectoire moyenne')
-        axes[0, 1].axhline(y=self.prix_initial, color='blue', linestyle='--', 
-                          label=f'Prix initial: {self.prix_initial:.0f}$')
+        axes[0, 1].axhline(y=params.prix_initial, color='blue', linestyle='--', 
+                          label=f'Prix initial: {params.prix_initial:.0f}$')
         axes[0, 1].set_title('Trajectoires de Prix Simulées')
         axes[0, 1].set_xlabel('Années')
         axes[0, 1].set_ylabel('Prix (USD/oz)')
         axes[0, 1].legend()
         axes[0, 1].grid(True, alpha=0.3)
         
-        # 3. Box plot des rendements par percentiles
-        percentiles = [5, 25, 50, 75, 95]
-        pct_values = [np.percentile(resultats['rendements_finaux'], p) for p in percentiles]
+        # 3. Box plot des rendements
         axes[0, 2].boxplot(resultats['rendements_finaux'], patch_artist=True)
         axes[0, 2].set_title('Box Plot des Rendements')
         axes[0, 2].set_ylabel('Rendement (%)')
         axes[0, 2].grid(True, alpha=0.3)
         
         # 4. Distribution des valeurs finales
-        axes[1, 0].hist(resultats['valeurs_finales'], bins=50, alpha=0.7, color='green', edgecolor='black')
-        axes[1, 0].axvline(statistiques['valeur_moyenne'], color='red', linestyle='--',
-                          label=f'Moyenne: {statistiques["valeur_moyenne"]:,.0f}$')
+        effectifs, bords = np.histogram(resultats['valeurs_finales'], bins=50)
+        axes[1, 0].bar(bords[:-1], effectifs, width=np.diff(bords), align='edge',
+                       alpha=0.7, color='green', edgecolor='black')
+        axes[1, 0].axvline(statistiques.valeur_moyenne, color='red', linestyle='--',
+                          label=f'Moyenne: {statistiques.valeur_moyenne:,.0f}$')
         axes[1, 0].axvline(resultats['investissement_total'], color='orange', linestyle='--',
                           label=f'Investi: {resultats["investissement_total"]:,.0f}$')
         axes[1, 0].set_title('Distribution des Valeurs Finales')
@@ -278,9 +624,9 @@ class MonteCarloGoldDCA:
         axes[1, 0].legend()
         axes[1, 0].grid(True, alpha=0.3)
         
-        # 5. Scatter plot rendement vs valeur finale
-        axes[1, 1].scatter(resultats['rendements_finaux'], resultats['valeurs_finales'], 
-                          alpha=0.5, s=1)
+        # 5. Densité rendement vs valeur finale (binning 2D plutôt qu'un marqueur par simulation)
+        axes[1, 1].hist2d(resultats['rendements_finaux'], resultats['valeurs_finales'],
+                          bins=80, cmap='Blues', cmin=1)
         axes[1, 1].axvline(0, color='red', linestyle='--', alpha=0.7)
         axes[1, 1].axhline(resultats['investissement_total'], color='orange', linestyle='--', alpha=0.7)
         axes[1, 1].set_title('Rendement vs Valeur Finale')
@@ -289,17 +635,13 @@ class MonteCarloGoldDCA:
         axes[1, 1].grid(True, alpha=0.3)
         
         # 6. Intervalles de confiance dans le temps
-        prix_trajectoires = resultats['prix_trajectoires']
-        prix_p5 = np.percentile(prix_trajectoires, 5, axis=0)
-        prix_p25 = np.percentile(prix_trajectoires, 25, axis=0)
-        prix_p75 = np.percentile(prix_trajectoires, 75, axis=0)
-        prix_p95 = np.percentile(prix_trajectoires, 95, axis=0)
-        prix_median = np.percentile(prix_trajectoires, 50, axis=0)
+        prix_p5, prix_p25, prix_median, prix_p75, prix_p95 = np.quantile(
+            prix_trajectoires, [0.05, 0.25, 0.5, 0.75, 0.95], axis=0
+        )
         
-        years = range(self.nombre_annees)
-        axes[1, 2].fill_between(years, prix_p5, prix_p95, alpha=0.2, color='gray', label='90% CI')
-        axes[1, 2].fill_between(years, prix_p25, prix_p75, alpha=0.4, color='blue', label='50% CI')
-        axes[1, 2].plot(years, prix_median, color='red', linewidth=2, label='Médiane')
+        axes[1, 2].fill_between(annees, prix_p5, prix_p95, alpha=0.2, color='gray', label='90% CI')
+        axes[1, 2].fill_between(annees, prix_p25, prix_p75, alpha=0.4, color='blue', label='50% CI')
+        axes[1, 2].plot(annees, prix_median, color='red', linewidth=2, label='Médiane')
         axes[1, 2].set_title('Intervalles de Confiance des Prix')
         axes[1, 2].set_xlabel('Années')
         axes[1, 2].set_ylabel('Prix (USD/oz)')
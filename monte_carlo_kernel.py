@@ -0,0 +1,185 @@
+"""
+Noyau Monte Carlo compilé pour l'investissement DCA sur l'or
+Fusionne la génération des trajectoires de prix et l'accumulation DCA des onces
+en une seule boucle par simulation (Numba, optionnel)
+Fournit aussi le calcul compilé des moments et de la volatilité glissante
+des rendements historiques
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_DISPONIBLE = True
+except ImportError:
+    # Numba est optionnel : sans lui, le noyau reste du Python pur
+    NUMBA_DISPONIBLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fonction: fonction
+
+@njit(parallel=True, fastmath=True, cache=True)
+def mc_paths(investissement_annuel, prix_initial, frais_par_once, drift, volatility, chocs,
+             conserver_trajectoires):
+    """
+    Simule toutes les trajectoires (modèle géométrique brownien) et l'achat
+    annuel d'onces, une simulation par itération parallèle
+    
+    Args:
+        investissement_annuel: Montant investi chaque année en USD
+        prix_initial: Prix de l'or au début de la simulation
+        frais_par_once: Frais annuels par once détenue en USD
+        drift: Rendement moyen annuel
+        volatility: Volatilité annuelle
+        chocs: Array float32 (nb_simulations, nombre_annees - 1) de tirages N(0, 1)
+        conserver_trajectoires: Si False, prix_trajectoires est vide (seuls les
+            scalaires par simulation sont calculés)
+    
+    Returns:
+        Tuple (prix_trajectoires, onces_finales, valeurs_finales,
+        profits_finaux, rendements_finaux)
+    """
+    nb_simulations = chocs.shape[0]
+    nombre_annees = chocs.shape[1] + 1
+    derive = drift - 0.5 * volatility ** 2
+    investissement_total = investissement_annuel * nombre_annees
+    
+    # Trajectoires stockées dans le type des chocs (float32), cumuls scalaires en float64
+    nb_trajectoires = nb_simulations if conserver_trajectoires else 0
+    prix_trajectoires = np.empty((nb_trajectoires, nombre_annees), dtype=chocs.dtype)
+    onces_finales = np.empty(nb_simulations)
+    valeurs_finales = np.empty(nb_simulations)
+    profits_finaux = np.empty(nb_simulations)
+    rendements_finaux = np.empty(nb_simulations)
+    
+    for sim in prange(nb_simulations):
+        prix = prix_initial
+        if conserver_trajectoires:
+            prix_trajectoires[sim, 0] = prix
+        onces = investissement_annuel / prix
+        
+        # Formule: S(t+1) = S(t) * exp((drift - 0.5*vol²)*dt + vol*sqrt(dt)*epsilon), dt = 1 an
+        for t in range(1, nombre_annees):
+            prix = prix * np.exp(derive + volatility * chocs[sim, t - 1])
+            if conserver_trajectoires:
+                prix_trajectoires[sim, t] = prix
+            onces += investissement_annuel / prix
+        
+        # Valeur nette : valeur brute moins les frais sur toutes les années
+        valeur = onces * prix - onces * frais_par_once * nombre_annees
+        onces_finales[sim] = onces
+        valeurs_finales[sim] = valeur
+        profits_finaux[sim] = valeur - investissement_total
+        rendements_finaux[sim] = (valeur - investissement_total) / investissement_total * 100
+    
+    return prix_trajectoires, onces_finales, valeurs_finales, profits_finaux, rendements_finaux
+
+@njit(cache=True)
+def moments_rendements(rendements):
+    """
+    Calcule en deux passes sur l'array les statistiques descriptives des rendements
+    
+    Returns:
+        Tuple (moyenne, écart-type non biaisé, minimum, maximum, asymétrie,
+        aplatissement), asymétrie et aplatissement (excès) étant les estimateurs
+        biaisés, comme scipy.stats.skew et scipy.stats.kurtosis par défaut
+    """
+    n = rendements.shape[0]
+    somme = 0.0
+    minimum = rendements[0]
+    maximum = rendements[0]
+    for i in range(n):
+        valeur = rendements[i]
+        somme += valeur
+        if valeur < minimum:
+            minimum = valeur
+        if valeur > maximum:
+            maximum = valeur
+    moyenne = somme / n
+    
+    # Moments centrés d'ordre 2, 3 et 4
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+    for i in range(n):
+        ecart = rendements[i] - moyenne
+        ecart2 = ecart * ecart
+        m2 += ecart2
+        m3 += ecart2 * ecart
+        m4 += ecart2 * ecart2
+    m2 /= n
+    m3 /= n
+    m4 /= n
+    
+    ecart_type = np.sqrt(m2 * n / (n - 1))
+    asymetrie = m3 / m2 ** 1.5
+    aplatissement = m4 / (m2 * m2) - 3.0
+    return moyenne, ecart_type, minimum, maximum, asymetrie, aplatissement
+
+def _moments_rendements_numpy(rendements):
+    """
+    Mêmes statistiques que moments_rendements, par formules vectorisées NumPy
+    (utilisé sans Numba : bien plus rapide que la boucle en Python pur)
+    """
+    n = rendements.shape[0]
+    moyenne = rendements.mean()
+    ecarts = rendements - moyenne
+    ecarts2 = ecarts * ecarts
+    m2 = ecarts2.mean()
+    m3 = (ecarts2 * ecarts).mean()
+    m4 = (ecarts2 * ecarts2).mean()
+    
+    ecart_type = np.sqrt(m2 * n / (n - 1))
+    asymetrie = m3 / m2 ** 1.5
+    aplatissement = m4 / (m2 * m2) - 3.0
+    return moyenne, ecart_type, rendements.min(), rendements.max(), asymetrie, aplatissement
+
+if not NUMBA_DISPONIBLE:
+    moments_rendements = _moments_rendements_numpy
+
+@njit(cache=True)
+def ecart_type_glissant(valeurs, fenetre):
+    """
+    Calcule l'écart-type non biaisé sur une fenêtre glissante en une seule passe
+    (sommes et sommes des carrés mises à jour à chaque pas)
+    
+    Returns:
+        Array float64 de même longueur, NaN tant que la fenêtre n'est pas pleine
+        (équivalent à pandas Series.rolling(fenetre).std())
+    """
+    n = valeurs.shape[0]
+    resultat = np.empty(n)
+    somme = 0.0
+    somme_carres = 0.0
+    for i in range(n):
+        valeur = valeurs[i]
+        somme += valeur
+        somme_carres += valeur * valeur
+        if i >= fenetre:
+            ancienne = valeurs[i - fenetre]
+            somme -= ancienne
+            somme_carres -= ancienne * ancienne
+        if i >= fenetre - 1:
+            # Les erreurs d'arrondi peuvent rendre la variance légèrement négative
+            variance = (somme_carres - somme * somme / fenetre) / (fenetre - 1)
+            resultat[i] = np.sqrt(max(variance, 0.0))
+        else:
+            resultat[i] = np.nan
+    return resultat
+
+def _ecart_type_glissant_numpy(valeurs, fenetre):
+    """
+    Même calcul que ecart_type_glissant, par fenêtres glissantes NumPy
+    (utilisé sans Numba : plus rapide que la boucle en Python pur)
+    """
+    resultat = np.full(valeurs.shape[0], np.nan)
+    if valeurs.shape[0] >= fenetre:
+        fenetres = np.lib.stride_tricks.sliding_window_view(valeurs, fenetre)
+        resultat[fenetre - 1:] = fenetres.std(axis=1, ddof=1)
+    return resultat
+
+if not NUMBA_DISPONIBLE:
+    ecart_type_glissant = _ecart_type_glissant_numpy
@@ -3,10 +3,80 @@ Script interactif pour la simulation DCA personnalisée sur l'or
 Inclut maintenant les simulations Monte Carlo
 """
 
-from dca_simulation import GoldDCASimulator
-from monte_carlo_dca import MonteCarloGoldDCA
-from hybrid_dca_simulator import HybridDCASimulator
-from volatility_analysis import GoldVolatilityAnalysis
+from dataclasses import dataclass, field, fields, replace
+
+# Séparateur des valeurs saisies sur une seule ligne (la virgule peut être décimale)
+SEPARATEUR_SAISIE = ';'
+
+@dataclass
+class SaisieHistorique:
+    """Paramètres saisis pour une simulation DCA historique"""
+    investissement_annuel: float = field(default=1000.0, metadata={'invite': "Montant d'investissement annuel en USD"})
+    nombre_annees: int = field(default=10, metadata={'invite': "Nombre d'années d'investissement"})
+    annee_debut: int = field(default=2010, metadata={'invite': "Année de début de l'investissement"})
+    frais_par_once: float = field(default=25.0, metadata={'invite': "Frais annuels par once d'or en USD"})
+
+@dataclass
+class SaisieMonteCarlo:
+    """Paramètres saisis pour une simulation Monte Carlo"""
+    investissement_annuel: float = field(default=2000.0, metadata={'invite': "Investissement annuel en USD"})
+    nombre_annees: int = field(default=15, metadata={'invite': "Nombre d'années"})
+    prix_initial: float = field(default=2400.0, metadata={'invite': "Prix initial de l'or en USD"})
+    frais_par_once: float = field(default=30.0, metadata={'invite': "Frais par once par an"})
+    nb_simulations: int = field(default=2000, metadata={'invite': "Nombre de simulations"})
+
+@dataclass
+class SaisieHybride:
+    """Paramètres saisis pour une simulation hybride"""
+    investissement_annuel: float = field(default=3000.0, metadata={'invite': "Investissement annuel en USD"})
+    nombre_annees: int = field(default=15, metadata={'invite': "Nombre d'années"})
+    annee_debut: int = field(default=2009, metadata={'invite': "Année de début pour comparaison historique"})
+    frais_par_once: float = field(default=30.0, metadata={'invite': "Frais par once par an"})
+    nb_simulations: int = field(default=2000, metadata={'invite': "Nombre de simulations Monte Carlo"})
+
+def saisir_parametres(classe_saisie):
+    """
+    Demande les paramètres d'une classe de saisie, un par ligne ou tous en une fois
+    
+    Si la première réponse contient des points-virgules, elle doit donner une
+    valeur par champ, dans l'ordre (valeur vide = défaut), et les questions
+    suivantes ne sont pas posées. Une saisie invalide est redemandée.
+    """
+    saisie = classe_saisie()
+    champs = fields(classe_saisie)
+    valeurs = {}
+    i = 0
+    while i < len(champs):
+        champ = champs[i]
+        defaut = getattr(saisie, champ.name)
+        reponse = input(f"{champ.metadata['invite']} [{defaut:g}]: ").strip()
+        try:
+            if i == 0 and SEPARATEUR_SAISIE in reponse:
+                # Toutes les valeurs sur une seule ligne
+                textes = [texte.strip() for texte in reponse.split(SEPARATEUR_SAISIE)]
+                if len(textes) != len(champs):
+                    print(f"{len(champs)} valeurs attendues ({len(textes)} saisies), veuillez recommencer")
+                    continue
+                valeurs = {champ_lot.name: champ_lot.type(texte)
+                           for champ_lot, texte in zip(champs, textes) if texte}
+                break
+            if reponse:
+                valeurs[champ.name] = champ.type(reponse)
+        except ValueError:
+            print("Valeur invalide (nombre attendu, décimales avec un point), veuillez recommencer")
+            continue
+        i += 1
+    return replace(saisie, **valeurs)
+
+# Réponses acceptées comme « oui » aux questions o/n
+REPONSES_OUI = frozenset({'o', 'oui', 'y', 'yes'})
+
+def confirmer(question: str, defaut: bool = False) -> bool:
+    """
+    Pose une question o/n ; une réponse vide retourne la valeur par défaut
+    """
+    reponse = input(f"{question} (o/n) [{'o' if defaut else 'n'}]: ").strip().lower()
+    return reponse in REPONSES_OUI if reponse else defaut
 
 def simulation_personnalisee():
     """
@@ -16,36 +86,27 @@ def simulation_personnalisee():
     print("SIMULATION DCA PERSONNALISÉE SUR L'OR")
     print("=" * 60)
     
+    # Les simulateurs ne sont importés qu'à leur première utilisation (menu plus rapide)
+    from dca_simulation import GoldDCASimulator
+    
     # Créer l'instance du simulateur
     simulator = GoldDCASimulator()
     
     # Demander les paramètres à l'utilisateur (ou utiliser des valeurs par défaut)
     print("\nConfiguration de votre simulation:")
-    print("(Appuyez sur Entrée pour utiliser la valeur par défaut)")
-    
-    # 1. Niveau d'investissement annuel
-    investissement_str = input("Montant d'investissement annuel en USD [1000]: ").strip()
-    investissement_annuel = float(investissement_str) if investissement_str else 1000.0
+    print("(Appuyez sur Entrée pour utiliser la valeur par défaut,")
+    print(" ou saisissez toutes les valeurs sur la première ligne, séparées par des points-virgules)")
     
-    # 2. Nombre d'années d'investissement
-    annees_str = input("Nombre d'années d'investissement [10]: ").strip()
-    nombre_annees = int(annees_str) if annees_str else 10
-    
-    # 3. Année de début
-    debut_str = input("Année de début de l'investissement [2010]: ").strip()
-    annee_debut = int(debut_str) if debut_str else 2010
-    
-    # 4. Frais par once
-    frais_str = input("Frais annuels par once d'or en USD [25]: ").strip()
-    frais_par_once = float(frais_str) if frais_str else 25.0
+    # Investissement annuel, nombre d'années, année de début, frais par once
+    saisie = saisir_parametres(SaisieHistorique)
     
     # Configurer et exécuter la simulation
     try:
         simulator.configure_simulation(
-            investissement_annuel=investissement_annuel,
-            nombre_annees=nombre_annees,
-            annee_debut=annee_debut,
-            frais_par_once=frais_par_once
+            investissement_annuel=saisie.investissement_annuel,
+            nombre_annees=saisie.nombre_annees,
+            annee_debut=saisie.annee_debut,
+            frais_par_once=saisie.frais_par_once
         )
         
         print("\nExécution de la simulation...")
@@ -55,13 +116,11 @@ def simulation_personnalisee():
         simulator.afficher_resultats(resultats)
         
         # Demander si l'utilisateur veut voir le tableau détaillé
-        voir_detail = input("\nVoulez-vous voir le tableau détaillé année par année? (o/n) [n]: ").strip().lower()
-        if voir_detail in ['o', 'oui', 'y', 'yes']:
+        if confirmer("\nVoulez-vous voir le tableau détaillé année par année?"):
             simulator.afficher_tableau_detaille(resultats)
         
         # Demander si l'utilisateur veut voir les graphiques
-        voir_graphiques = input("\nVoulez-vous voir les graphiques? (o/n) [n]: ").strip().lower()
-        if voir_graphiques in ['o', 'oui', 'y', 'yes']:
+        if confirmer("\nVoulez-vous voir les graphiques?"):
             simulator.creer_graphiques(resultats)
             
     except ValueError as e:
@@ -72,6 +131,8 @@ def exemples_predefinies():
     """
     Exécute plusieurs exemples de simulations prédéfinies
     """
+    from dca_simulation import GoldDCASimulator
+    
     simulator = GoldDCASimulator()
     
     exemples = [
@@ -126,6 +187,8 @@ def analyser_periodes():
     print("ANALYSE COMPARATIVE DE DIFFÉRENTES PÉRIODES")
     print("=" * 80)
     
+    from dca_simulation import GoldDCASimulator
+    
     simulator = GoldDCASimulator()
     
     periodes = [
@@ -138,35 +201,30 @@ def analyser_periodes():
         {"nom": "Post-COVID", "debut": 2020, "fin": 2024}
     ]
     
-    resultats_comparaison = []
-    
-    for periode in periodes:
-        annees = periode["fin"] - periode["debut"] + 1
-        if annees > 0:
-            try:
-                simulator.configure_simulation(
-                    investissement_annuel=1000,  # Standardisé à 1000 USD
-                    nombre_annees=annees,
-                    annee_debut=periode["debut"],
-                    frais_par_once=25  # Frais standardisés
-                )
-                
-                resultats = simulator.simuler_dca()
-                rendement_final = resultats['rendement_pourcent'][-1]
-                
-                resultats_comparaison.append({
-                    "periode": periode["nom"],
-                    "debut": periode["debut"],
-                    "fin": periode["fin"],
-                    "duree": annees,
-                    "rendement": rendement_final,
-                    "investissement_total": resultats['investissement_cumule'][-1],
-                    "valeur_finale": resultats['valeur_portefeuille'][-1],
-                    "onces_finales": resultats['onces_totales'][-1]
-                })
-                
-            except (ValueError, KeyError):
-                continue  # Ignorer les périodes sans données
+    # Ne garder que les périodes couvertes par les données (une seule passe)
+    periodes_valides = [p for p in periodes if simulator.donnees_disponibles(p["debut"], p["fin"])]
+    
+    # Toutes les périodes évaluées en un seul lot vectorisé (investissement et frais standardisés)
+    lot = simulator.simuler_dca_periodes(
+        [p["debut"] for p in periodes_valides],
+        [p["fin"] for p in periodes_valides],
+        investissement_annuel=1000,
+        frais_par_once=25
+    )
+    
+    resultats_comparaison = [
+        {
+            "periode": periode["nom"],
+            "debut": periode["debut"],
+            "fin": periode["fin"],
+            "duree": int(lot["duree"][i]),
+            "rendement": lot["rendement"][i],
+            "investissement_total": lot["investissement_total"][i],
+            "valeur_finale": lot["valeur_finale"][i],
+            "onces_finales": lot["onces_finales"][i]
+        }
+        for i, periode in enumerate(periodes_valides)
+    ]
     
     # Afficher la comparaison
     print(f"\n{'Période':<30} {'Début':<6} {'Fin':<6} {'Durée':<6} {'Rendement':<12} {'Onces':<8}")
@@ -188,25 +246,14 @@ def simulation_monte_carlo():
     print("SIMULATION MONTE CARLO DCA")
     print("=" * 60)
     
+    from monte_carlo_dca import MonteCarloGoldDCA
+    
     simulator = MonteCarloGoldDCA()
     
     print("\nConfiguration de la simulation Monte Carlo:")
     
-    # Paramètres d'investissement
-    investissement_str = input("Investissement annuel en USD [2000]: ").strip()
-    investissement_annuel = float(investissement_str) if investissement_str else 2000.0
-    
-    annees_str = input("Nombre d'années [15]: ").strip()
-    nombre_annees = int(annees_str) if annees_str else 15
-    
-    prix_str = input("Prix initial de l'or en USD [2400]: ").strip()
-    prix_initial = float(prix_str) if prix_str else 2400.0
-    
-    frais_str = input("Frais par once par an [30]: ").strip()
-    frais_par_once = float(frais_str) if frais_str else 30.0
-    
-    simulations_str = input("Nombre de simulations [2000]: ").strip()
-    nb_simulations = int(simulations_str) if simulations_str else 2000
+    # Paramètres d'investissement (un par ligne, ou tous sur la première séparés par des points-virgules)
+    saisie = saisir_parametres(SaisieMonteCarlo)
     
     # Choix de la période de volatilité
     print("\nChoisissez la période de référence pour la volatilité:")
@@ -221,22 +268,21 @@ def simulation_monte_carlo():
     
     # Configuration et exécution
     simulator.configure_simulation(
-        investissement_annuel=investissement_annuel,
-        nombre_annees=nombre_annees,
-        prix_initial=prix_initial,
-        frais_par_once=frais_par_once,
-        nb_simulations=nb_simulations,
+        investissement_annuel=saisie.investissement_annuel,
+        nombre_annees=saisie.nombre_annees,
+        prix_initial=saisie.prix_initial,
+        frais_par_once=saisie.frais_par_once,
+        nb_simulations=saisie.nb_simulations,
         period=period
     )
     
-    print(f"\nExécution de {nb_simulations:,} simulations Monte Carlo...")
+    print(f"\nExécution de {saisie.nb_simulations:,} simulations Monte Carlo...")
     resultats = simulator.simuler_dca_monte_carlo()
     statistiques = simulator.calculer_statistiques(resultats)
     
     simulator.afficher_resultats_monte_carlo(resultats, statistiques)
     
-    voir_graphiques = input("\nVoir les graphiques? (o/n) [n]: ").strip().lower()
-    if voir_graphiques in ['o', 'oui', 'y', 'yes']:
+    if confirmer("\nVoir les graphiques?"):
         simulator.creer_graphiques_monte_carlo(resultats, statistiques)
 
 def simulation_hybride():
@@ -247,41 +293,29 @@ def simulation_hybride():
     print("SIMULATION HYBRIDE DCA")
     print("=" * 60)
     
+    from hybrid_dca_simulator import HybridDCASimulator
+    
     simulator = HybridDCASimulator()
     
     print("\nConfiguration de la simulation hybride:")
     
-    investissement_str = input("Investissement annuel en USD [3000]: ").strip()
-    investissement_annuel = float(investissement_str) if investissement_str else 3000.0
-    
-    annees_str = input("Nombre d'années [15]: ").strip()
-    nombre_annees = int(annees_str) if annees_str else 15
-    
-    debut_str = input("Année de début pour comparaison historique [2009]: ").strip()
-    annee_debut = int(debut_str) if debut_str else 2009
-    
-    frais_str = input("Frais par once par an [30]: ").strip()
-    frais_par_once = float(frais_str) if frais_str else 30.0
-    
-    simulations_str = input("Nombre de simulations Monte Carlo [2000]: ").strip()
-    nb_simulations = int(simulations_str) if simulations_str else 2000
+    # Un paramètre par ligne, ou tous sur la première séparés par des points-virgules
+    saisie = saisir_parametres(SaisieHybride)
     
     # Exécution
     print(f"\nExécution de la simulation hybride...")
     resultats = simulator.simulation_complete(
-        investissement_annuel=investissement_annuel,
-        nombre_annees=nombre_annees,
-        annee_debut_historique=annee_debut,
-        frais_par_once=frais_par_once,
-        nb_simulations_mc=nb_simulations
+        investissement_annuel=saisie.investissement_annuel,
+        nombre_annees=saisie.nombre_annees,
+        annee_debut_historique=saisie.annee_debut,
+        frais_par_once=saisie.frais_par_once,
+        nb_simulations_mc=saisie.nb_simulations
     )
     
-    voir_comparaison = input("\nVoir comparaison des périodes de volatilité? (o/n) [n]: ").strip().lower()
-    if voir_comparaison in ['o', 'oui', 'y', 'yes']:
-        simulator.comparaison_periodes_volatilite(investissement_annuel, nombre_annees)
+    if confirmer("\nVoir comparaison des périodes de volatilité?"):
+        simulator.comparaison_periodes_volatilite(saisie.investissement_annuel, saisie.nombre_annees)
     
-    voir_graphiques = input("\nVoir les graphiques de comparaison? (o/n) [n]: ").strip().lower()
-    if voir_graphiques in ['o', 'oui', 'y', 'yes']:
+    if confirmer("\nVoir les graphiques de comparaison?"):
         simulator.creer_graphique_comparaison(resultats)
 
 def analyse_volatilite():
@@ -292,19 +326,24 @@ def analyse_volatilite():
     print("ANALYSE DE VOLATILITÉ DE L'OR")
     print("=" * 60)
     
+    from volatility_analysis import GoldVolatilityAnalysis
+    
     analyzer = GoldVolatilityAnalysis()
     
     print("Génération du rapport d'analyse...")
     analyzer.print_analysis_report()
     
-    voir_graphiques = input("\nVoir les graphiques d'analyse? (o/n) [o]: ").strip().lower()
-    if voir_graphiques in ['o', 'oui', 'y', 'yes', '']:
+    if confirmer("\nVoir les graphiques d'analyse?", defaut=True):
         analyzer.plot_historical_analysis()
 
 def menu_principal():
     """
     Menu principal pour choisir le type de simulation
     """
+    # Données chargées dès le démarrage : le premier choix du menu trouve le cache prêt
+    from data_cache import load_prices
+    load_prices()
+    
     while True:
         print("\n" + "=" * 60)
         print("SIMULATEUR DCA OR - MENU PRINCIPAL")
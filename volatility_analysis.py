@@ -2,44 +2,60 @@
 Analyse de la volatilité historique de l'or pour alimenter les simulations Monte Carlo
 """
 
+import os
+import sys
+from functools import cached_property
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import stats
+from data_cache import load_prices
+from monte_carlo_kernel import ecart_type_glissant, moments_rendements
 
 class GoldVolatilityAnalysis:
     def __init__(self, data_file: str = "data/annual.csv"):
         """
         Analyse la volatilité historique des prix de l'or
         """
-        self.df = pd.read_csv(data_file)
-        self.df['Date'] = self.df['Date'].astype(int)
-        self.df = self.df.set_index('Date').sort_index()
+        # Prix partagés avec les autres simulateurs (CSV lu une seule fois, années triées)
+        annees, prix = load_prices(data_file)
         
-        # Calculer les rendements annuels
-        self.df['Returns'] = self.df['Price'].pct_change()
-        self.df['Log_Returns'] = np.log(self.df['Price'] / self.df['Price'].shift(1))
+        # Rendements en arrays NumPy contigus (un seul calcul, sans surcoût pandas par appel)
+        prix_np = np.ascontiguousarray(prix, dtype=np.float64)
+        self.returns = prix_np[1:] / prix_np[:-1] - 1
+        self.log_returns = np.diff(np.log(prix_np))
+        self.years = np.ascontiguousarray(annees[1:])
+        self.prices = prix_np[1:]
         
-        # Supprimer les valeurs NaN
-        self.df = self.df.dropna()
+        # DataFrame construit directement à partir des arrays alignés (la première
+        # année, sans rendement, est exclue) : ni tri, ni pct_change, ni dropna
+        self.df = pd.DataFrame({'Price': self.prices, 'Returns': self.returns},
+                               index=pd.Index(self.years, name='Date'))
         
     def calculate_volatility_metrics(self) -> dict:
         """
         Calcule les métriques de volatilité et de rendement
         """
-        returns = self.df['Returns'].dropna()
-        log_returns = self.df['Log_Returns'].dropna()
+        return dict(self._metrics)
+    
+    @cached_property
+    def _metrics(self) -> dict:
+        """
+        Métriques globales, calculées une seule fois (self.df ne change plus après __init__)
+        """
+        # Tous les moments en un seul appel au noyau (compilé si Numba est installé)
+        mean_return, std_return, min_return, max_return, skewness, kurtosis = \
+            moments_rendements(self.returns)
+        mean_log_return, std_log_return = moments_rendements(self.log_returns)[:2]
         
         metrics = {
-            'mean_return': returns.mean(),
-            'std_return': returns.std(),
-            'mean_log_return': log_returns.mean(),
-            'std_log_return': log_returns.std(),
-            'min_return': returns.min(),
-            'max_return': returns.max(),
-            'skewness': stats.skew(returns),
-            'kurtosis': stats.kurtosis(returns),
-            'sharpe_ratio': returns.mean() / returns.std() if returns.std() > 0 else 0
+            'mean_return': mean_return,
+            'std_return': std_return,
+            'mean_log_return': mean_log_return,
+            'std_log_return': std_log_return,
+            'min_return': min_return,
+            'max_return': max_return,
+            'skewness': skewness,
+            'kurtosis': kurtosis,
+            'sharpe_ratio': mean_return / std_return if std_return > 0 else 0
         }
         
         return metrics
@@ -48,6 +64,14 @@ class GoldVolatilityAnalysis:
         """
         Analyse la volatilité par périodes historiques
         """
+        # Copie de chaque période : le cache reste intact si l'appelant modifie le résultat
+        return {periode: dict(donnees) for periode, donnees in self._period_analysis.items()}
+    
+    @cached_property
+    def _period_analysis(self) -> dict:
+        """
+        Analyse par périodes, calculée une seule fois
+        """
         periods = {
             'Gold_Standard': (1833, 1971),
             'Post_Bretton_Woods': (1972, 1980), 
@@ -55,21 +79,38 @@ class GoldVolatilityAnalysis:
             'Modern_Era': (2001, 2024)
         }
         
+        # Périodes consécutives et triées : bornes des tranches par recherche dichotomique
+        limites = [start for start, _ in periods.values()] + [list(periods.values())[-1][1] + 1]
+        bornes = np.searchsorted(self.years, limites)
+        counts = np.diff(bornes)
+        
+        # Une seule passe réduite par tranche (reduceat) sur les rendements couverts ;
+        # les périodes vides sont retirées des indices pour ne pas fausser leurs voisines
+        returns = self.returns[bornes[0]:bornes[-1]]
+        non_vides = counts > 0
+        debuts = (bornes[:-1] - bornes[0])[non_vides]
+        n = counts[non_vides]
+        means = np.add.reduceat(returns, debuts) / n
+        ecarts = returns - np.repeat(means, n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            stds = np.sqrt(np.add.reduceat(ecarts * ecarts, debuts) / (n - 1))
+        mins = np.minimum.reduceat(returns, debuts)
+        maxs = np.maximum.reduceat(returns, debuts)
+        
         period_analysis = {}
         
-        for period_name, (start, end) in periods.items():
-            period_data = self.df[(self.df.index >= start) & (self.df.index <= end)]
-            if len(period_data) > 1:
-                returns = period_data['Returns'].dropna()
-                if len(returns) > 0:
-                    period_analysis[period_name] = {
-                        'years': f"{start}-{end}",
-                        'mean_return': returns.mean(),
-                        'std_return': returns.std(),
-                        'min_return': returns.min(),
-                        'max_return': returns.max(),
-                        'count': len(returns)
-                    }
+        noms_non_vides = [nom for nom, garde in zip(periods, non_vides) if garde]
+        for i, period_name in enumerate(noms_non_vides):
+            if n[i] > 1:
+                start, end = periods[period_name]
+                period_analysis[period_name] = {
+                    'years': f"{start}-{end}",
+                    'mean_return': means[i],
+                    'std_return': stds[i],
+                    'min_return': mins[i],
+                    'max_return': maxs[i],
+                    'count': int(n[i])
+                }
         
         return period_analysis
     
@@ -77,17 +118,8 @@ class GoldVolatilityAnalysis:
         """
         Obtient les paramètres pour les simulations Monte Carlo
         """
-        period_analysis = self.analyze_periods()
-        
-        if period in period_analysis:
-            params = period_analysis[period]
-        else:
-            # Utiliser les données complètes si la période n'est pas trouvée
-            metrics = self.calculate_volatility_metrics()
-            params = {
-                'mean_return': metrics['mean_return'],
-                'std_return': metrics['std_return']
-            }
+        # Analyse par périodes mémorisée, ou données complètes si la période n'est pas trouvée
+        params = self._period_analysis.get(period, self._metrics)
         
         return {
             'drift': params['mean_return'],
@@ -95,22 +127,37 @@ class GoldVolatilityAnalysis:
             'period_used': period
         }
     
-    def plot_historical_analysis(self):
+    def plot_historical_analysis(self, fichier: str = "analyse_volatilite_or.png"):
         """
         Crée des graphiques d'analyse historique
+        
+        Args:
+            fichier: Image enregistrée à la place de l'affichage quand la
+                variable d'environnement NOGUI est définie
         """
+        import matplotlib
+        sans_interface = bool(os.environ.get('NOGUI'))
+        if sans_interface:
+            # Sans interface : backend Agg, pas d'initialisation de Qt/Tk
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('Analyse Historique des Prix de l\'Or', fontsize=16, fontweight='bold')
         
+        # Arrays NumPy alignés (années, prix et rendements de même longueur)
+        years = self.years
+        returns = self.returns
+        
         # Prix historiques
-        axes[0, 0].plot(self.df.index, self.df['Price'], linewidth=1)
+        axes[0, 0].plot(years, self.prices, linewidth=1, rasterized=True)
         axes[0, 0].set_title('Prix Historique de l\'Or')
         axes[0, 0].set_xlabel('Année')
         axes[0, 0].set_ylabel('Prix (USD/oz)')
         axes[0, 0].grid(True, alpha=0.3)
         
         # Rendements annuels
-        axes[0, 1].plot(self.df.index[1:], self.df['Returns'].dropna(), linewidth=1, color='green')
+        axes[0, 1].plot(years, returns, linewidth=1, color='green', rasterized=True)
         axes[0, 1].axhline(y=0, color='red', linestyle='--', alpha=0.7)
         axes[0, 1].set_title('Rendements Annuels')
         axes[0, 1].set_xlabel('Année')
@@ -118,9 +165,11 @@ class GoldVolatilityAnalysis:
         axes[0, 1].grid(True, alpha=0.3)
         
         # Distribution des rendements
-        returns = self.df['Returns'].dropna()
-        axes[1, 0].hist(returns, bins=30, alpha=0.7, color='blue', edgecolor='black')
-        axes[1, 0].axvline(returns.mean(), color='red', linestyle='--', label=f'Moyenne: {returns.mean():.3f}')
+        moyenne = self._metrics['mean_return']
+        effectifs, bords = np.histogram(returns, bins=30)
+        axes[1, 0].bar(bords[:-1], effectifs, width=np.diff(bords), align='edge',
+                       alpha=0.7, color='blue', edgecolor='black')
+        axes[1, 0].axvline(moyenne, color='red', linestyle='--', label=f'Moyenne: {moyenne:.3f}')
         axes[1, 0].set_title('Distribution des Rendements')
         axes[1, 0].set_xlabel('Rendement')
         axes[1, 0].set_ylabel('Fréquence')
@@ -128,50 +177,57 @@ class GoldVolatilityAnalysis:
         axes[1, 0].grid(True, alpha=0.3)
         
         # Volatilité roulante (10 ans)
-        rolling_vol = self.df['Returns'].rolling(window=10).std()
-        axes[1, 1].plot(rolling_vol.index, rolling_vol, linewidth=1, color='orange')
+        rolling_vol = ecart_type_glissant(returns, 10)
+        axes[1, 1].plot(years, rolling_vol, linewidth=1, color='orange', rasterized=True)
         axes[1, 1].set_title('Volatilité Roulante (10 ans)')
         axes[1, 1].set_xlabel('Année')
         axes[1, 1].set_ylabel('Volatilité')
         axes[1, 1].grid(True, alpha=0.3)
         
         plt.tight_layout()
-        plt.show()
+        if sans_interface:
+            fig.savefig(fichier, dpi=100)
+            plt.close(fig)
+            print(f"Graphiques enregistrés dans {os.path.abspath(fichier)}")
+        else:
+            plt.show()
     
     def print_analysis_report(self):
         """
         Imprime un rapport d'analyse détaillé
         """
-        print("=" * 80)
-        print("ANALYSE DE LA VOLATILITÉ HISTORIQUE DE L'OR")
-        print("=" * 80)
-        
-        # Métriques globales
+        # Rapport construit ligne par ligne puis écrit en une seule fois
         metrics = self.calculate_volatility_metrics()
+        lignes = [
+            "=" * 80,
+            "ANALYSE DE LA VOLATILITÉ HISTORIQUE DE L'OR",
+            "=" * 80,
+            
+            # Métriques globales
+            "\nMÉTRIQUES GLOBALES (1834-2024):",
+            f"Rendement annuel moyen: {metrics['mean_return']:.3f} ({metrics['mean_return']*100:.1f}%)",
+            f"Volatilité (écart-type): {metrics['std_return']:.3f} ({metrics['std_return']*100:.1f}%)",
+            f"Rendement minimum: {metrics['min_return']:.3f} ({metrics['min_return']*100:.1f}%)",
+            f"Rendement maximum: {metrics['max_return']:.3f} ({metrics['max_return']*100:.1f}%)",
+            f"Asymétrie (skewness): {metrics['skewness']:.3f}",
+            f"Aplatissement (kurtosis): {metrics['kurtosis']:.3f}",
+            f"Ratio de Sharpe: {metrics['sharpe_ratio']:.3f}",
+            
+            # Analyse par périodes
+            "\nANALYSE PAR PÉRIODES:",
+            f"{'Période':<20} {'Années':<12} {'Rend. Moy.':<12} {'Volatilité':<12} {'Min':<10} {'Max':<10}",
+            "-" * 80,
+        ]
+        
+        lignes.extend(f"{period_name.replace('_', ' '):<20} "
+                      f"{data['years']:<12} "
+                      f"{data['mean_return']*100:<11.1f}% "
+                      f"{data['std_return']*100:<11.1f}% "
+                      f"{data['min_return']*100:<9.1f}% "
+                      f"{data['max_return']*100:<9.1f}%"
+                      for period_name, data in self.analyze_periods().items())
         
-        print("\nMÉTRIQUES GLOBALES (1834-2024):")
-        print(f"Rendement annuel moyen: {metrics['mean_return']:.3f} ({metrics['mean_return']*100:.1f}%)")
-        print(f"Volatilité (écart-type): {metrics['std_return']:.3f} ({metrics['std_return']*100:.1f}%)")
-        print(f"Rendement minimum: {metrics['min_return']:.3f} ({metrics['min_return']*100:.1f}%)")
-        print(f"Rendement maximum: {metrics['max_return']:.3f} ({metrics['max_return']*100:.1f}%)")
-        print(f"Asymétrie (skewness): {metrics['skewness']:.3f}")
-        print(f"Aplatissement (kurtosis): {metrics['kurtosis']:.3f}")
-        print(f"Ratio de Sharpe: {metrics['sharpe_ratio']:.3f}")
-        
-        # Analyse par périodes
-        period_analysis = self.analyze_periods()
-        
-        print(f"\nANALYSE PAR PÉRIODES:")
-        print(f"{'Période':<20} {'Années':<12} {'Rend. Moy.':<12} {'Volatilité':<12} {'Min':<10} {'Max':<10}")
-        print("-" * 80)
-        
-        for period_name, data in period_analysis.items():
-            print(f"{period_name.replace('_', ' '):<20} "
-                  f"{data['years']:<12} "
-                  f"{data['mean_return']*100:<11.1f}% "
-                  f"{data['std_return']*100:<11.1f}% "
-                  f"{data['min_return']*100:<9.1f}% "
-                  f"{data['max_return']*100:<9.1f}%")
+        sys.stdout.write("\n".join(lignes) + "\n")
 
 def main():
     """